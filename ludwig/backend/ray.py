@@ -32,6 +32,7 @@ from ray.air import session
 from ray.air.checkpoint import Checkpoint
 from ray.air.config import DatasetConfig, RunConfig, ScalingConfig
 from ray.air.result import Result
+from ray.data.context import DatasetContext
 from ray.train.base_trainer import TrainingFailedError
 from ray.train.torch import TorchCheckpoint
 from ray.train.trainer import BaseTrainer as RayBaseTrainer
@@ -82,6 +83,11 @@ logger = logging.getLogger(__name__)
 
 
 RAY_DEFAULT_PARALLELISM = 200
+
+# Minimum number of blocks in the training set before its global shuffle uses Ray's push-based shuffle, which merges
+# map outputs on the reducers while the map phase is still running. Below this, the default pull-based shuffle has
+# less scheduling overhead.
+PUSH_BASED_SHUFFLE_MIN_BLOCKS = 256
 FIFTEEN_MINS_IN_S = 15 * 60
 
 
@@ -172,6 +178,7 @@ def train_fn(
     remote_trainer_cls: Type[BaseTrainer] = None,  # noqa: F821
     training_set_metadata: TrainingSetMetadataDict = None,
     features: Dict[str, Dict] = None,
+    local_shuffle_buffer_size: Optional[int] = None,
     **kwargs,
 ):
     # Pin GPU before loading the model to prevent memory leaking onto other devices
@@ -182,6 +189,7 @@ def train_fn(
             session.get_dataset_shard("train"),
             features,
             training_set_metadata,
+            local_shuffle_buffer_size=local_shuffle_buffer_size,
         )
 
         try:
@@ -401,7 +409,11 @@ class RayAirRunner:
                 dataset_conf.required = True
                 # Check data loader kwargs to see if shuffle should be enabled for the
                 # train dataset. global_shuffle is False by default for all other datasets.
-                dataset_conf.global_shuffle = data_loader_kwargs.get("shuffle", True)
+                # When a local shuffle buffer is configured, each worker shuffles batches within the buffer as
+                # it reads instead, which avoids the all-to-all data movement of a global shuffle every epoch.
+                dataset_conf.global_shuffle = data_loader_kwargs.get("shuffle", True) and not data_loader_kwargs.get(
+                    "local_shuffle_buffer_size"
+                )
             dataset_configs[dataset_name] = dataset_conf
         return dataset_configs
 
@@ -424,6 +436,8 @@ class RayAirRunner:
         callbacks = callbacks or []
 
         trainer_cls, kwargs = self.dist_strategy.get_trainer_cls(self.backend_config)
+        if _use_push_based_shuffle(dataset, dataset_config):
+            trainer_cls = _with_push_based_shuffle(trainer_cls)
         train_loop_config = {**config, "distributed_strategy": self.strategy}
         trainer = trainer_cls(
             train_loop_per_worker=train_loop_per_worker,
@@ -441,6 +455,33 @@ class RayAirRunner:
             return fit_no_exception(trainer)
 
 
+def _use_push_based_shuffle(
+    dataset: Optional[Dict[str, Any]], dataset_config: Optional[Dict[str, DatasetConfig]]
+) -> bool:
+    """Returns True if the training set will be globally shuffled and is large enough to use push-based shuffle."""
+    if not dataset or "train" not in dataset or not dataset_config or not dataset_config["train"].global_shuffle:
+        return False
+    return dataset["train"].num_blocks() >= PUSH_BASED_SHUFFLE_MIN_BLOCKS
+
+
+def _with_push_based_shuffle(trainer_cls: Type[RayBaseTrainer]) -> Type[RayBaseTrainer]:
+    """Returns a subclass of the Ray AIR trainer that enables push-based shuffle where the dataset shards are built.
+
+    The shards, including their global shuffle, are created on the remote trainable actor, whose DatasetContext is
+    separate from the driver's, so the setting is applied in `setup`, which runs on that actor before the datasets are
+    preprocessed and split.
+    """
+
+    class PushBasedShuffleTrainer(trainer_cls):
+        def setup(self) -> None:
+            DatasetContext.get_current().use_push_based_shuffle = True
+            super().setup()
+
+    PushBasedShuffleTrainer.__name__ = trainer_cls.__name__
+    PushBasedShuffleTrainer.__qualname__ = trainer_cls.__qualname__
+    return PushBasedShuffleTrainer
+
+
 @register_ray_trainer(MODEL_ECD, default=True)
 class RayTrainerV2(BaseTrainer):
     def __init__(
@@ -477,6 +518,11 @@ class RayTrainerV2(BaseTrainer):
         kwargs = {
             "training_set_metadata": training_set.training_set_metadata,
             "features": training_set.features,
+            "local_shuffle_buffer_size": (
+                self.data_loader_kwargs.get("local_shuffle_buffer_size")
+                if self.data_loader_kwargs.get("shuffle", True)
+                else None
+            ),
             **kwargs,
         }
 
@@ -774,12 +774,14 @@ class ComparatorCombiner(Combiner):
     ):
         super().__init__(input_features)
         self.name = "ComparatorCombiner"
-        logger.debug(f"Entering {self.name}")
+        logger.debug(f" {self.name}")
 
         self.entity_1 = config.entity_1
         self.entity_2 = config.entity_2
-        self.required_inputs = set(config.entity_1 + config.entity_2)
+        self.required_inputs = frozenset(config.entity_1 + config.entity_2)
         self.output_size = config.output_size
+        self.shared_fc = config.shared_fc
+        self.shared_fc_single_pass = False
 
         self.fc_stack = None
 
@@ -792,21 +794,10 @@ class ComparatorCombiner(Combiner):
 
         if fc_layers is not None:
             logger.debug("Setting up FCStack")
+            e1_shape = self.get_entity_shape(config.entity_1)
+            e2_shape = self.get_entity_shape(config.entity_2)
             self.e1_fc_stack = FCStack(
-                self.get_entity_shape(config.entity_1)[-1],
-                layers=fc_layers,
-                num_layers=config.num_fc_layers,
-                default_output_size=config.output_size,
-                default_use_bias=config.use_bias,
-                default_weights_initializer=config.weights_initializer,
-                default_bias_initializer=config.bias_initializer,
-                default_norm=config.norm,
-                default_norm_params=config.norm_params,
-                default_activation=config.activation,
-                default_dropout=config.dropout,
-            )
-            self.e2_fc_stack = FCStack(
-                self.get_entity_shape(config.entity_2)[-1],
+                e1_shape[-1],
                 layers=fc_layers,
                 num_layers=config.num_fc_layers,
                 default_output_size=config.output_size,
@@ -818,6 +809,33 @@ class ComparatorCombiner(Combiner):
                 default_activation=config.activation,
                 default_dropout=config.dropout,
             )
+            if config.shared_fc:
+                if e1_shape != e2_shape:
+                    raise ValueError(
+                        "`shared_fc` requires both entities to have the same flattened input size. "
+                        f"entity1 shape: {e1_shape} "
+                        f"entity2 shape: {e2_shape}"
+                    )
+                self.e2_fc_stack = self.e1_fc_stack
+                # Batch norm statistics would be computed over both entities at once in a single concatenated pass,
+                # so stacks with batch norm still project each entity separately.
+                self.shared_fc_single_pass = not any(
+                    isinstance(module, torch.nn.modules.batchnorm._BatchNorm) for module in self.e1_fc_stack.modules()
+                )
+            else:
+                self.e2_fc_stack = FCStack(
+                    e2_shape[-1],
+                    layers=fc_layers,
+                    num_layers=config.num_fc_layers,
+                    default_output_size=config.output_size,
+                    default_use_bias=config.use_bias,
+                    default_weights_initializer=config.weights_initializer,
+                    default_bias_initializer=config.bias_initializer,
+                    default_norm=config.norm,
+                    default_norm_params=config.norm_params,
+                    default_activation=config.activation,
+                    default_dropout=config.dropout,
+                )
 
         self.last_fc_layer_output_size = fc_layers[-1]["output_size"]
 
@@ -835,48 +853,46 @@ class ComparatorCombiner(Combiner):
     def output_shape(self) -> torch.Size:
         return torch.Size([2 * self.last_fc_layer_output_size + 2])
 
+    @staticmethod
+    def get_entity_hidden(inputs: Dict, entity: list) -> torch.Tensor:
+        """Flattens and concatenates the encoder outputs of the features of an entity into a single 2D tensor.
+
+        This is the only point where encoder outputs enter the combiner. `torch.reshape` returns a view for contiguous
+        encoder outputs and only copies the ones with a non-contiguous layout, and a single concatenation produces a
+        contiguous result for the fully connected stack.
+        """
+        enc_outputs = [inputs[k][ENCODER_OUTPUT] for k in entity]
+        batch_size = enc_outputs[0].shape[0]
+        enc_outputs = [torch.reshape(eo, [batch_size, -1]) for eo in enc_outputs]
+        if len(enc_outputs) > 1:
+            return torch.cat(enc_outputs, 1)
+        return enc_outputs[0].contiguous()
+
     def forward(
         self,
         inputs: Dict,  # encoder outputs
     ) -> Dict[str, torch.Tensor]:  # encoder outputs
-        if inputs.keys() != self.required_inputs:
-            raise ValueError(f"Missing inputs {self.required_inputs - set(inputs.keys())}")
+        if not inputs.keys() >= self.required_inputs:
+            raise ValueError(f"Missing inputs {self.required_inputs - inputs.keys()}")
 
         ############
         # Entity 1 #
         ############
-        e1_enc_outputs = [inputs[k][ENCODER_OUTPUT] for k in self.entity_1]
-
-        # ================ Flatten ================
-        batch_size = e1_enc_outputs[0].shape[0]
-        e1_enc_outputs = [torch.reshape(eo, [batch_size, -1]) for eo in e1_enc_outputs]
-
-        # ================ Concat ================
-        if len(e1_enc_outputs) > 1:
-            e1_hidden = torch.cat(e1_enc_outputs, 1)
-        else:
-            e1_hidden = list(e1_enc_outputs)[0]
-
-        # ================ Fully Connected ================
-        e1_hidden = self.e1_fc_stack(e1_hidden)  # [bs, output_size]
+        e1_hidden = self.get_entity_hidden(inputs, self.entity_1)  # [bs, e1_size]
 
         ############
         # Entity 2 #
         ############
-        e2_enc_outputs = [inputs[k][ENCODER_OUTPUT] for k in self.entity_2]
-
-        # ================ Flatten ================
-        batch_size = e2_enc_outputs[0].shape[0]
-        e2_enc_outputs = [torch.reshape(eo, [batch_size, -1]) for eo in e2_enc_outputs]
-
-        # ================ Concat ================
-        if len(e2_enc_outputs) > 1:
-            e2_hidden = torch.cat(e2_enc_outputs, 1)
-        else:
-            e2_hidden = list(e2_enc_outputs)[0]
+        e2_hidden = self.get_entity_hidden(inputs, self.entity_2)  # [bs, e2_size]
 
         # ================ Fully Connected ================
-        e2_hidden = self.e2_fc_stack(e2_hidden)  # [bs, output_size]
+        if self.shared_fc and self.shared_fc_single_pass:
+            # project both entities with a single pass through the shared stack
+            hidden = self.e1_fc_stack(torch.cat([e1_hidden, e2_hidden], 0))  # [2 * bs, output_size]
+            e1_hidden, e2_hidden = torch.chunk(hidden, 2, 0)  # [bs, output_size]
+        else:
+            e1_hidden = self.e1_fc_stack(e1_hidden)  # [bs, output_size]
+            e2_hidden = self.e2_fc_stack(e2_hidden)  # [bs, output_size]
 
         ###########
         # Compare #
@@ -891,17 +907,9 @@ class ComparatorCombiner(Combiner):
         element_wise_mul = e1_hidden * e2_hidden  # [bs, output_size]
         dot_product = torch.sum(element_wise_mul, 1, keepdim=True)  # [bs, 1]
         abs_diff = torch.abs(e1_hidden - e2_hidden)  # [bs, output_size]
-        bilinear_prod = torch.bmm(
-            torch.mm(e1_hidden, self.bilinear_weights).unsqueeze(1), e2_hidden.unsqueeze(-1)
-        ).squeeze(
-            -1
-        )  # [bs, 1]
+        # row-wise e1 W e2^T, computed without materializing a transposed or batched copy of e2_hidden
+        bilinear_prod = torch.sum(torch.mm(e1_hidden, self.bilinear_weights) * e2_hidden, 1, keepdim=True)  # [bs, 1]
 
-        logger.debug(
-            "preparing combiner output by concatenating these tensors: "
-            f"dot_product: {dot_product.shape}, element_size_mul: {element_wise_mul.shape}"
-            f", abs_diff: {abs_diff.shape}, bilinear_prod {bilinear_prod.shape}"
-        )
         hidden = torch.cat([dot_product, element_wise_mul, abs_diff, bilinear_prod], 1)  # [bs, 2 * output_size + 2]
 
         return {"combiner_output": hidden}
@@ -1,8 +1,9 @@
 """Checks that are not easily covered by marshmallow JSON schema validation like parameter interdependencies."""
 
 from abc import ABC, abstractmethod
+from functools import lru_cache
 from re import findall
-from typing import Callable, TYPE_CHECKING
+from typing import Callable, FrozenSet, Set, Tuple, TYPE_CHECKING
 
 from transformers import AutoConfig
 
@@ -17,15 +18,17 @@ from ludwig.constants import (
     MODEL_ECD,
     MODEL_GBM,
     MODEL_LLM,
+    NAME,
     NUMBER,
     SEQUENCE,
     SET,
     TEXT,
     TIMESERIES,
+    TYPE,
     VECTOR,
 )
 from ludwig.error import ConfigValidationError
-from ludwig.utils.metric_utils import get_feature_to_metric_names_map_from_feature_collection
+from ludwig.utils.metric_utils import get_feature_to_metric_names_map
 from ludwig.utils.misc_utils import merge_dict
 
 if TYPE_CHECKING:
@@ -34,6 +37,9 @@ if TYPE_CHECKING:
 # Set of all sequence feature types.
 SEQUENCE_OUTPUT_FEATURE_TYPES = {SEQUENCE, TEXT, SET, VECTOR}
 
+# Set of input feature types that can be encoded by sequence encoders like the stacked transformer.
+SEQUENCE_INPUT_FEATURE_TYPES = {SEQUENCE, TEXT, TIMESERIES}
+
 
 class ConfigCheckRegistry:
     """A registry of configuration checks."""
@@ -73,9 +79,67 @@ class ConfigCheck(ABC):
         raise NotImplementedError
 
 
+def _check_tied_feature_valid(input_feature, input_feature_names: Set[str]) -> None:
+    """Checks that the feature an input feature is tied to exists."""
+    if input_feature.tied and input_feature.tied not in input_feature_names:
+        raise ConfigValidationError(
+            f"Feature {input_feature.name} is tied to feature {input_feature.tied}, but the "
+            f"'{input_feature.tied}' feature does not exist."
+        )
+
+
+def _check_feature_in_memory_preprocessing(input_feature, config: "ModelConfig") -> None:  # noqa: F821
+    """Checks that audio and image features use in memory preprocessing with Ray backend."""
+    if input_feature.type == AUDIO or input_feature.type == IMAGE:
+        if not input_feature.preprocessing.in_memory and config.backend.type != "ray":
+            raise ConfigValidationError(
+                "RayBackend does not support lazy loading of data files at train time. "
+                f"Set preprocessing config `in_memory: True` for input feature {input_feature.name}"
+            )
+
+
+def _check_hf_tokenizer_requirements(input_feature) -> None:
+    """Checks that the HuggingFace tokenizer has a pretrained_model_name_or_path specified."""
+    if input_feature.preprocessing.tokenizer == "hf_tokenizer":
+        if input_feature.preprocessing.pretrained_model_name_or_path is None:
+            raise ConfigValidationError("Pretrained model name or path must be specified for HuggingFace tokenizer.")
+
+
+def _check_hf_encoder_requirements(input_feature) -> None:
+    """Checks that a HuggingFace encoder has a pretrained_model_name_or_path specified."""
+    if hasattr(input_feature.encoder, "use_pretrained"):
+        if input_feature.preprocessing.pretrained_model_name_or_path is None:
+            raise ConfigValidationError("Pretrained model name or path must be specified for HuggingFace encoder.")
+
+
+def _check_stacked_transformer_requirements(input_feature) -> None:
+    """Checks that the transformer encoder type correctly configures `num_heads` and `hidden_size`"""
+    encoder = input_feature.encoder
+    if encoder.type == "transformer" and encoder.hidden_size % encoder.num_heads != 0:
+        raise ConfigValidationError(
+            f"Input feature {input_feature.name} transformer encoder requires encoder.hidden_size to be divisible "
+            f"by encoder.num_heads. Found hidden_size {encoder.hidden_size} and num_heads {encoder.num_heads}."
+        )
+
+
+def _uses_in_memory_preprocessing_checks(config: "ModelConfig") -> bool:  # noqa: F821
+    """Returns whether the config has the backend and trainer settings the in memory preprocessing checks need."""
+    return (
+        config.backend is not None
+        and hasattr(config.trainer, "preprocessing")
+        and hasattr(config.trainer.preprocessing, IN_MEMORY)
+    )
+
+
 @register_config_check
-def check_feature_names_unique(config: "ModelConfig") -> None:  # noqa: F821
-    """Checks that all feature names are unique."""
+def check_input_features(config: "ModelConfig") -> None:  # noqa: F821
+    """Checks feature name uniqueness and the per input feature requirements in a single pass over the input
+    features.
+
+    Input features are checked one at a time, so the error reported for an invalid config is the first one found for
+    the first invalid input feature. Since this check is registered first, its errors are reported before those of the
+    checks registered after it.
+    """
     input_features = config.input_features
     input_feature_names = {input_feature.name for input_feature in input_features}
 
@@ -85,19 +149,16 @@ def check_feature_names_unique(config: "ModelConfig") -> None:  # noqa: F821
     if len(input_feature_names) + len(output_feature_names) != len(input_features) + len(output_features):
         raise ConfigValidationError("Feature names must be unique.")
 
-
-@register_config_check
-def check_tied_features_valid(config: "ModelConfig") -> None:  # noqa: F821
-    """Checks that all tied features are valid."""
-    input_features = config.input_features
-    input_feature_names = {input_feature.name for input_feature in input_features}
-
+    check_in_memory_preprocessing = _uses_in_memory_preprocessing_checks(config)
     for input_feature in input_features:
-        if input_feature.tied and input_feature.tied not in input_feature_names:
-            raise ConfigValidationError(
-                f"Feature {input_feature.name} is tied to feature {input_feature.tied}, but the "
-                f"'{input_feature.tied}' feature does not exist."
-            )
+        _check_tied_feature_valid(input_feature, input_feature_names)
+        if check_in_memory_preprocessing:
+            _check_feature_in_memory_preprocessing(input_feature, config)
+        if input_feature.type == TEXT:
+            _check_hf_tokenizer_requirements(input_feature)
+            _check_hf_encoder_requirements(input_feature)
+        if input_feature.type in SEQUENCE_INPUT_FEATURE_TYPES:
+            _check_stacked_transformer_requirements(input_feature)
 
 
 @register_config_check
@@ -140,9 +201,7 @@ def check_gbm_output_type(config: "ModelConfig") -> None:  # noqa: F821
 @register_config_check
 def check_ray_backend_in_memory_preprocessing(config: "ModelConfig") -> None:  # noqa: F821
     """Checks that in memory preprocessing is used with Ray backend."""
-    if config.backend is None:
-        return
-    if not hasattr(config.trainer, "preprocessing") or not hasattr(config.trainer.preprocessing, IN_MEMORY):
+    if not _uses_in_memory_preprocessing_checks(config):
         return
 
     if config.backend.type == "ray" and not config.trainer.preprocessing.in_memory:
@@ -151,14 +210,6 @@ def check_ray_backend_in_memory_preprocessing(config: "ModelConfig") -> None:  #
             "Set preprocessing config `in_memory: True`"
         )
 
-    for input_feature in config.input_features:
-        if input_feature.type == AUDIO or input_feature.type == IMAGE:
-            if not input_feature.preprocessing.in_memory and config.backend.type != "ray":
-                raise ConfigValidationError(
-                    "RayBackend does not support lazy loading of data files at train time. "
-                    f"Set preprocessing config `in_memory: True` for input feature {input_feature.name}"
-                )
-
 
 def check_sequence_concat_combiner_requirements(config: "ModelConfig") -> None:  # noqa: F821
     """Checks that sequence concat combiner has at least one input feature that's sequential."""
@@ -185,7 +236,7 @@ def check_comparator_combiner_requirements(config: "ModelConfig") -> None:  # no
     if config.combiner.type != "comparator":
         return
 
-    input_feature_names = [input_feature.name for input_feature in config.input_features]
+    input_feature_names = {input_feature.name for input_feature in config.input_features}
     for feature_name in config.combiner.entity_1:
         if feature_name not in input_feature_names:
             raise ConfigValidationError(
@@ -197,7 +248,9 @@ def check_comparator_combiner_requirements(config: "ModelConfig") -> None:  # no
                 f"Feature {feature_name} in entity_2 for the comparator combiner is not a valid " "input feature name."
             )
 
-    if sorted(config.combiner.entity_1 + config.combiner.entity_2) != sorted(input_feature_names):
+    entity_feature_names = set(config.combiner.entity_1) | set(config.combiner.entity_2)
+    num_entity_features = len(config.combiner.entity_1) + len(config.combiner.entity_2)
+    if num_entity_features != len(config.input_features) or entity_feature_names != input_feature_names:
         raise ConfigValidationError("Not all input features are present as entities in the comparator combiner.")
 
 
@@ -220,21 +273,35 @@ def check_sampling_exclusivity(config: "ModelConfig") -> None:  # noqa: F821
         )
 
 
+@lru_cache(maxsize=128)
+def _get_all_valid_metric_names(output_features_signature: Tuple[Tuple[str, str], ...]) -> FrozenSet[str]:
+    """Returns the names of all metrics available for output features given as a tuple of (name, type) pairs.
+
+    Cached since the same output features are checked repeatedly, e.g. once per hyperopt trial.
+    """
+    feature_to_metric_names_map = get_feature_to_metric_names_map(
+        [{NAME: name, TYPE: feature_type} for name, feature_type in output_features_signature]
+    )
+    all_valid_metrics = set()
+    for metric_names in feature_to_metric_names_map.values():
+        all_valid_metrics.update(metric_names)
+    return frozenset(all_valid_metrics)
+
+
 @register_config_check
 def check_validation_metric_exists(config: "ModelConfig") -> None:  # noqa: F821
     """Checks that the specified validation metric exists."""
     validation_metric_name = config.trainer.validation_metric
 
     # Get all valid metrics.
-    feature_to_metric_names_map = get_feature_to_metric_names_map_from_feature_collection(config.output_features)
-    all_valid_metrics = set()
-    for metric_names in feature_to_metric_names_map.values():
-        all_valid_metrics.update(metric_names)
+    all_valid_metrics = _get_all_valid_metric_names(
+        tuple((output_feature.name, output_feature.type) for output_feature in config.output_features)
+    )
 
     if validation_metric_name not in all_valid_metrics:
         raise ConfigValidationError(
             f"User-specified trainer.validation_metric '{validation_metric_name}' is not valid. "
-            f"Available metrics are: {all_valid_metrics}"
+            f"Available metrics are: {set(all_valid_metrics)}"
         )
 
 
@@ -247,56 +314,6 @@ def check_splitter(config: "ModelConfig") -> None:  # noqa: F821
     splitter.validate(config)
 
 
-@register_config_check
-def check_hf_tokenizer_requirements(config: "ModelConfig") -> None:  # noqa: F821
-    """Checks that the HuggingFace tokenizer has a pretrained_model_name_or_path specified."""
-
-    for input_feature in config.input_features:
-        if input_feature.type == TEXT:
-            if input_feature.preprocessing.tokenizer == "hf_tokenizer":
-                if input_feature.preprocessing.pretrained_model_name_or_path is None:
-                    raise ConfigValidationError(
-                        "Pretrained model name or path must be specified for HuggingFace tokenizer."
-                    )
-
-
-@register_config_check
-def check_hf_encoder_requirements(config: "ModelConfig") -> None:  # noqa: F821
-    """Checks that a HuggingFace encoder has a pretrained_model_name_or_path specified."""
-
-    for input_feature in config.input_features:
-        if input_feature.type == TEXT:
-            if hasattr(input_feature.encoder, "use_pretrained"):
-                if input_feature.preprocessing.pretrained_model_name_or_path is None:
-                    raise ConfigValidationError(
-                        "Pretrained model name or path must be specified for HuggingFace encoder."
-                    )
-
-
-@register_config_check
-def check_stacked_transformer_requirements(config: "ModelConfig") -> None:  # noqa: F821
-    """Checks that the transformer encoder type correctly configures `num_heads` and `hidden_size`"""
-
-    def is_divisible(hidden_size: int, num_heads: int) -> bool:
-        """Checks that hidden_size is divisible by num_heads."""
-        return hidden_size % num_heads == 0
-
-    sequence_types = [SEQUENCE, TEXT, TIMESERIES]
-
-    for input_feature in config.input_features:
-        if_type = input_feature.type
-        encoder = input_feature.encoder
-        if (
-            if_type in sequence_types
-            and encoder.type == "transformer"
-            and not is_divisible(encoder.hidden_size, encoder.num_heads)
-        ):
-            raise ConfigValidationError(
-                f"Input feature {input_feature.name} transformer encoder requires encoder.hidden_size to be divisible "
-                f"by encoder.num_heads. Found hidden_size {encoder.hidden_size} and num_heads {encoder.num_heads}."
-            )
-
-
 @register_config_check
 def check_hyperopt_search_algorithm_dependencies_installed(config: "ModelConfig") -> None:  # noqa: F821
     """Check that the hyperopt search algorithm dependencies are installed."""
@@ -2,6 +2,7 @@ import logging
 import os
 import queue
 import threading
+from concurrent.futures import ThreadPoolExecutor
 
 from ludwig.api_annotations import DeveloperAPI, PublicAPI
 from ludwig.callbacks import Callback
@@ -15,6 +16,12 @@ mlflow = LazyLoader("mlflow", globals(), "mlflow")
 
 logger = logging.getLogger(__name__)
 
+# Maximum number of params that the MLflow tracking server accepts in a single log_batch request.
+MAX_PARAMS_PER_BATCH = 100
+
+# Number of threads used to upload the files of the output directory as artifacts.
+MAX_ARTIFACT_UPLOAD_WORKERS = 8
+
 
 def _get_runs(experiment_id: str):
     return mlflow.tracking.client.MlflowClient().search_runs([experiment_id])
@@ -201,8 +208,12 @@ class MlflowCallback(Callback):
 
     def _log_params(self, params):
         flat_params = flatten_dict(params)
-        for chunk in chunk_dict(flat_params, chunk_size=100):
-            mlflow.log_params(chunk)
+        # Resolve the run and client once for all chunks. Params are sent with one log_batch request per chunk of
+        # MAX_PARAMS_PER_BATCH, the maximum number of params the tracking server accepts in a single request.
+        run_id = (mlflow.active_run() or mlflow.start_run()).info.run_id
+        client = mlflow.tracking.MlflowClient()
+        for chunk in chunk_dict(flat_params, chunk_size=MAX_PARAMS_PER_BATCH):
+            client.log_batch(run_id, params=[mlflow.entities.Param(k, str(v)) for k, v in chunk.items()])
 
     def __setstate__(self, d):
         self.__dict__ = d
@@ -256,12 +267,21 @@ def _log_mlflow(log_metrics, steps, save_path, should_continue, log_artifacts: b
 
 
 def _log_artifacts(output_directory):
-    for fname in os.listdir(output_directory):
-        lpath = os.path.join(output_directory, fname)
-        if fname == "model":
-            _log_model(lpath)
-        else:
-            mlflow.log_artifact(lpath)
+    # Resolve the run in the calling thread, as the active run is not visible from the upload threads
+    run_id = (mlflow.active_run() or mlflow.start_run()).info.run_id
+    client = mlflow.tracking.MlflowClient()
+    with os.scandir(output_directory) as entries:
+        paths = {entry.name: entry.path for entry in entries}
+
+    with ThreadPoolExecutor(max_workers=MAX_ARTIFACT_UPLOAD_WORKERS) as executor:
+        futures = [
+            executor.submit(client.log_artifact, run_id, path) for name, path in paths.items() if name != "model"
+        ]
+        if "model" in paths:
+            _log_model(paths["model"])
+        # Surface any upload errors
+        for future in futures:
+            future.result()
 
 
 def _log_model(lpath):
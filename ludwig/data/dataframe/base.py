@@ -46,6 +46,11 @@ class DataFrameEngine(ABC):
 
     @abstractmethod
     def map_partitions(self, series, map_fn, meta=None):
+        """Applies map_fn to each partition of the input as a whole (the entire input for unpartitioned engines).
+
+        Prefer this over map_objects and apply_objects when map_fn can be written with vectorized pandas / NumPy
+        operations, as it avoids a Python function call per row.
+        """
         raise NotImplementedError()
 
     @abstractmethod
@@ -54,6 +59,10 @@ class DataFrameEngine(ABC):
 
     @abstractmethod
     def apply_objects(self, series, map_fn, meta=None):
+        """Applies map_fn to each row of the input DataFrame, calling it once per row.
+
+        For functions that can operate on a whole DataFrame at once, use map_partitions instead.
+        """
         raise NotImplementedError()
 
     @abstractmethod
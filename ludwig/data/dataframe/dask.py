@@ -17,34 +17,38 @@
 import collections
 import logging
 from contextlib import contextmanager
-from typing import Dict
+from typing import Dict, TYPE_CHECKING
 
 import dask
-import dask.array as da
 import dask.dataframe as dd
-import ray
+import pandas as pd
+from dask.delayed import Delayed
 from dask.diagnostics import ProgressBar
-from packaging import version
 from pyarrow.fs import FSSpecHandler, PyFileSystem
-from ray.data import Dataset, read_parquet
 
 from ludwig.api_annotations import DeveloperAPI
 from ludwig.data.dataframe.base import DataFrameEngine
-from ludwig.utils.data_utils import get_pa_schema, get_parquet_filename, split_by_slices
+from ludwig.utils.data_utils import get_pa_schema, get_parquet_compression_kwargs, get_parquet_filename, split_by_slices
 from ludwig.utils.dataframe_utils import set_index_name
 from ludwig.utils.fs_utils import get_fs_and_path
 
+if TYPE_CHECKING:
+    from ray.data import Dataset
+
 TMP_COLUMN = "__TMP_COLUMN__"
 
+# Target in-memory size of a partition when converting a pandas DataFrame without an explicit parallelism.
+TARGET_PARTITION_SIZE_BYTES = 128 * 1024 * 1024
+
+# Number of leading rows whose deep memory usage is measured to estimate the size of a whole pandas DataFrame.
+PARTITION_SIZE_SAMPLE_ROWS = 1000
+
 # This is to be compatible with pyarrow.lib.schema
 PandasBlockSchema = collections.namedtuple("PandasBlockSchema", ["names", "types"])
 
 logger = logging.getLogger(__name__)
 
 
-_ray_230 = version.parse(ray.__version__) >= version.parse("2.3.0")
-
-
 @DeveloperAPI
 def set_scheduler(scheduler):
     dask.config.set(scheduler=scheduler)
@@ -69,14 +73,36 @@ def reset_index_across_all_partitions(df):
     return df
 
 
+def has_annotations(data) -> bool:
+    """Returns whether any layer of the task graph of the Dask collection carries annotations, e.g. Ray remote args
+    set with `dask.annotate`."""
+    layers = getattr(data.__dask_graph__(), "layers", None)
+    if layers is None:
+        return False
+    return any(layer.annotations for layer in layers.values())
+
+
+def get_npartitions_for_size(df, target_partition_size_bytes: int = TARGET_PARTITION_SIZE_BYTES) -> int:
+    """Returns the number of partitions needed to split a pandas DataFrame into partitions of roughly the target
+    in-memory size, so that large DataFrames are processed in parallel instead of as a single partition.
+
+    The size is extrapolated from the deep memory usage of the first rows, since measuring every string of a large
+    text DataFrame would cost a full extra pass over the data.
+    """
+    sample = df.iloc[:PARTITION_SIZE_SAMPLE_ROWS]
+    bytes_per_row = sample.memory_usage(index=True, deep=True).sum() / max(len(sample), 1)
+    df_size_bytes = bytes_per_row * len(df)
+    return max(1, min(len(df), int(df_size_bytes // target_partition_size_bytes)))
+
+
 @DeveloperAPI
 class DaskEngine(DataFrameEngine):
     def __init__(self, parallelism=None, persist=True, _use_ray=True, **kwargs):
-        from ray.util.dask import ray_dask_get
-
         self._parallelism = parallelism
         self._persist = persist
         if _use_ray:
+            from ray.util.dask import ray_dask_get
+
             set_scheduler(ray_dask_get)
 
     def set_parallelism(self, parallelism):
@@ -131,9 +157,11 @@ class DaskEngine(DataFrameEngine):
         return data
 
     def persist(self, data):
-        # No graph optimizations to prevent dropping custom annotations
+        if not self._persist:
+            return data
+        # No graph optimizations when the graph carries custom annotations to prevent dropping them
         # https://github.com/dask/dask/issues/7036
-        return data.persist(optimize_graph=False) if self._persist else data
+        return data.persist(optimize_graph=not has_annotations(data))
 
     def concat(self, dfs):
         return self.df_lib.multi.concat(dfs)
@@ -142,7 +170,9 @@ class DaskEngine(DataFrameEngine):
         return data.compute()
 
     def from_pandas(self, df):
-        parallelism = self._parallelism or 1
+        parallelism = self._parallelism or get_npartitions_for_size(df)
+        # Keep the default sort=True: it is a no-op for the usual monotonic index and gives known divisions, which
+        # df_like relies on to align processed columns with the input DataFrame.
         return dd.from_pandas(df, npartitions=parallelism)
 
     def map_objects(self, series, map_fn, meta=None):
@@ -175,7 +205,16 @@ class DaskEngine(DataFrameEngine):
         return df.apply(apply_fn, axis=1, meta=meta)
 
     def reduce_objects(self, series, reduce_fn):
-        return series.reduction(reduce_fn, aggregate=reduce_fn, meta=("data", "object")).compute()[0]
+        return self.reduce_objects_delayed(series, reduce_fn).compute()
+
+    def reduce_objects_delayed(self, series, reduce_fn) -> Delayed:
+        """Returns the reduction of the series as a Delayed object without computing it.
+
+        reduce_fn is applied to each partition and then to the Series of per-partition results. Several reductions
+        can be computed in a single scheduler submission with `dask.compute(*delayed_reductions)`.
+        """
+        partition_results = [dask.delayed(reduce_fn)(partition) for partition in series.to_delayed()]
+        return dask.delayed(lambda results: reduce_fn(pd.Series(results)))(partition_results)
 
     def split(self, df, probabilities):
         # Split the DataFrame proprotionately along partitions. This is an inexact solution designed
@@ -220,6 +259,9 @@ class DaskEngine(DataFrameEngine):
                 write_index=index,
                 schema=schema,
                 name_function=get_parquet_filename,
+                # Row groups are not sized here: estimating them would compute the first partition eagerly before
+                # the write computes it again, and each partition is already written as its own bounded file.
+                **get_parquet_compression_kwargs(),
             )
 
     def write_predictions(self, df: dd.DataFrame, path: str):
@@ -232,11 +274,13 @@ class DaskEngine(DataFrameEngine):
             ds.write_parquet(path, filesystem=PyFileSystem(FSSpecHandler(fs)))
 
     def read_predictions(self, path: str) -> dd.DataFrame:
+        from ray.data import read_parquet
+
         fs, path = get_fs_and_path(path)
         ds = read_parquet(path, filesystem=PyFileSystem(FSSpecHandler(fs)))
         return self.from_ray_dataset(ds)
 
-    def to_ray_dataset(self, df) -> Dataset:
+    def to_ray_dataset(self, df) -> "Dataset":
         from ray.data import from_dask
 
         return from_dask(df)
@@ -257,6 +301,8 @@ class DaskEngine(DataFrameEngine):
 
     @property
     def array_lib(self):
+        import dask.array as da
+
         return da
 
     @property
@@ -18,12 +18,17 @@ import os
 
 import modin.pandas as pd
 import numpy as np
+from pandas.api.types import is_numeric_dtype
 
 from ludwig.data.dataframe.base import DataFrameEngine
 from ludwig.globals import PREDICTIONS_SHAPES_FILE_NAME
-from ludwig.utils.data_utils import get_pa_schema, load_json, save_json, split_by_slices
+from ludwig.utils.data_utils import get_pa_schema, get_parquet_write_kwargs, load_json, save_json, split_by_slices
 from ludwig.utils.dataframe_utils import flatten_df, unflatten_df
 
+# Minimum number of elements (rows * columns) in a numeric frame before it is converted to a Ray Dataset directly
+# from its row partitions rather than through `ray.data.from_modin`.
+DISTRIBUTED_PUT_MIN_ELEMENTS = 6_000_000
+
 
 class ModinEngine(DataFrameEngine):
     def __init__(self, **kwargs):
@@ -73,6 +78,7 @@ class ModinEngine(DataFrameEngine):
             engine="pyarrow",
             index=index,
             schema=schema,
+            **get_parquet_write_kwargs(df),
         )
 
     def write_predictions(self, df: pd.DataFrame, path: str):
@@ -86,9 +92,17 @@ class ModinEngine(DataFrameEngine):
         return unflatten_df(pred_df, column_shapes, self)
 
     def to_ray_dataset(self, df):
-        from ray.data import from_modin
+        from modin.distributed.dataframe.pandas import unwrap_partitions
+        from ray.data import from_modin, from_pandas_refs
+
+        if len(df) * len(df.columns) <= DISTRIBUTED_PUT_MIN_ELEMENTS or not all(
+            is_numeric_dtype(dtype) for dtype in df.dtypes
+        ):
+            return from_modin(df)
 
-        return from_modin(df)
+        # Large numeric frames are converted from the object refs of their row partitions, which are already in the
+        # object store, so the data never passes through the driver.
+        return from_pandas_refs(unwrap_partitions(df, axis=0))
 
     def from_ray_dataset(self, dataset) -> pd.DataFrame:
         return dataset.to_modin()
@@ -20,7 +20,7 @@ import pandas as pd
 
 from ludwig.data.dataframe.base import DataFrameEngine
 from ludwig.globals import PREDICTIONS_SHAPES_FILE_NAME
-from ludwig.utils.data_utils import load_json, save_json, split_by_slices
+from ludwig.utils.data_utils import get_parquet_write_kwargs, load_json, save_json, split_by_slices
 from ludwig.utils.dataframe_utils import flatten_df, unflatten_df
 
 
@@ -71,7 +71,7 @@ class PandasEngine(DataFrameEngine):
         return df
 
     def to_parquet(self, df, path, index=False):
-        df.to_parquet(path, engine="pyarrow", index=index)
+        df.to_parquet(path, engine="pyarrow", index=index, **get_parquet_write_kwargs(df))
 
     def write_predictions(self, df: pd.DataFrame, path: str):
         df, column_shapes = flatten_df(df, self)
@@ -13,16 +13,13 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 # ==============================================================================
+import collections
 import contextlib
 import logging
-import math
-import queue
 import threading
-from functools import lru_cache
-from typing import Dict, Iterable, Iterator, Literal, Optional, Union
+from typing import Callable, Dict, Iterable, Iterator, List, Literal, Optional, Tuple, Union
 
 import numpy as np
-import pandas as pd
 import ray
 import torch
 from packaging import version
@@ -35,15 +32,16 @@ from ludwig.api_annotations import DeveloperAPI
 from ludwig.backend.base import Backend
 from ludwig.constants import NAME
 from ludwig.data.batcher.base import Batcher
+from ludwig.data.dataframe.dask import tensor_extension_casting
 from ludwig.data.dataset.base import Dataset, DatasetManager
 from ludwig.distributed import DistributedStrategy
 from ludwig.features.base_feature import BaseFeature
 from ludwig.types import FeatureConfigDict, ModelConfigDict, TrainingSetMetadataDict
-from ludwig.utils.data_utils import DATA_TRAIN_HDF5_FP, DATA_TRAIN_PARQUET_FP, from_numpy_dataset, to_numpy_dataset
+from ludwig.utils.data_utils import DATA_TRAIN_HDF5_FP, DATA_TRAIN_PARQUET_FP, get_parquet_compression_kwargs
 from ludwig.utils.dataframe_utils import to_scalar_df
 from ludwig.utils.defaults import default_random_seed
 from ludwig.utils.error_handling_utils import default_retry
-from ludwig.utils.fs_utils import get_fs_and_path
+from ludwig.utils.fs_utils import delete, get_fs_and_path, path_exists
 from ludwig.utils.misc_utils import get_proc_features
 from ludwig.utils.types import DataFrame
 
@@ -51,10 +49,17 @@ logger = logging.getLogger(__name__)
 
 _ray_230 = version.parse(ray.__version__) >= version.parse("2.3.0")
 
+# Number of blocks Ray prefetches in the background while iterating over batches of a dataset pipeline.
+PREFETCH_BLOCKS = 2
+
+# Maximum number of prepared batches buffered by each producer thread of the parallel reader.
+PARALLEL_READER_BUFFER_SIZE = 16
+
 
 @DeveloperAPI
 @default_retry()
-def read_remote_parquet(path: str):
+def read_remote_parquet(path: str, columns: Optional[List[str]] = None):
+    """Reads a Parquet dataset into a Ray Dataset, decoding only `columns` if given."""
     fs, path = get_fs_and_path(path)
 
     # Fix for https://github.com/ludwig-ai/ludwig/issues/3440
@@ -66,12 +71,64 @@ def read_remote_parquet(path: str):
     #     1) Passing an absolute filepath
     #     2) Not passing a filesystem object
     try:
-        df = read_parquet(path, filesystem=PyFileSystem(FSSpecHandler(fs)))
+        df = read_parquet(path, filesystem=PyFileSystem(FSSpecHandler(fs)), columns=columns)
     except ArrowInvalid:
-        df = read_parquet(path)
+        df = read_parquet(path, columns=columns)
     return df
 
 
+def make_column_preparer(
+    column: str, augmentations: Optional[Callable] = None, reshape: Optional[Tuple[int, ...]] = None
+) -> Callable[[np.ndarray], np.ndarray]:
+    """Returns a function converting a column of a numpy batch into the array consumed by the model.
+
+    Only the steps the column needs are included, so columns without augmentation or reshaping pay for neither.
+    """
+
+    def stack(values: np.ndarray) -> np.ndarray:
+        if values.dtype == "object":
+            # Ensure columns stacked instead of turned into np.array([np.array, ...], dtype=object) objects
+            return stack_object_array(values)
+        return values
+
+    if augmentations is None and reshape is None:
+        return stack
+
+    def prepare(values: np.ndarray) -> np.ndarray:
+        values = stack(values)
+        if augmentations is not None:
+            # TODO: convert to debug message when done with development
+            logger.info(f"RayDatasetBatcher applying augmentation pipeline to batch for feature {column}")
+
+            # apply augmentation pipeline operations to the batch of np.array
+            values = augmentations(torch.tensor(values)).numpy()
+        if reshape is not None:
+            values = values.reshape((-1, *reshape))
+        return values
+
+    return prepare
+
+
+def stack_object_array(values: np.ndarray) -> np.ndarray:
+    """Stacks a 1D object array of equally shaped arrays into a single array.
+
+    Equivalent to `np.stack(values)`, but copies each element directly into a preallocated output instead of building
+    an intermediate list of expanded arrays. Falls back to `np.stack` when elements differ in shape or dtype, so that
+    errors and dtype promotion are unchanged.
+    """
+    if len(values) == 0:
+        return np.stack(values)
+
+    first = np.asarray(values[0])
+    out = np.empty((len(values), *first.shape), dtype=first.dtype)
+    for i, v in enumerate(values):
+        v = np.asarray(v)
+        if v.shape != first.shape or v.dtype != first.dtype:
+            return np.stack(values)
+        out[i] = v
+    return out
+
+
 @DeveloperAPI
 class RayDataset(Dataset):
     """Wrapper around ray.data.Dataset.
@@ -94,7 +151,12 @@ class RayDataset(Dataset):
         window_size_bytes: Optional[Union[int, Literal["auto"]]] = None,
     ):
         self.df_engine = backend.df_engine
-        self.ds = self.df_engine.to_ray_dataset(df) if not isinstance(df, str) else read_remote_parquet(df)
+        self._length: Optional[int] = None
+        if isinstance(df, str):
+            # Only decode the columns of the model's features, skipping any other columns in the cached data
+            self.ds = read_remote_parquet(df, columns=list(features.keys()))
+        else:
+            self.ds = self.df_engine.to_ray_dataset(df)
         self.features = features
         self.training_set_metadata = training_set_metadata
         self.data_hdf5_fp = training_set_metadata.get(DATA_TRAIN_HDF5_FP)
@@ -149,8 +211,20 @@ class RayDataset(Dataset):
             augmentation_pipeline=augmentation_pipeline,
         )
 
+    @property
+    def ds(self) -> ray.data.Dataset:
+        return self._ds
+
+    @ds.setter
+    def ds(self, ds: ray.data.Dataset):
+        self._ds = ds
+        # Counting rows requires scanning block metadata, so it is cached until the underlying dataset changes
+        self._length = None
+
     def __len__(self):
-        return self.ds.count()
+        if self._length is None:
+            self._length = self.ds.count()
+        return self._length
 
     @property
     def size(self):
@@ -180,8 +254,13 @@ class RayDataset(Dataset):
         return self.ds.map_batches(lambda df: df[feat_cols], batch_size=None)
 
     def to_scalar(self, features: Optional[Iterable[BaseFeature]] = None) -> DataFrame:
-        ds = self.filter_features(features)
-        return ds.map_batches(lambda df: to_scalar_df(df), batch_size=None)
+        if features is None:
+            return self.ds.map_batches(to_scalar_df, batch_size=None)
+
+        # Select and flatten the columns within the same task, rather than materializing the filtered dataset in the
+        # object store first only to copy every block again when flattening it.
+        feat_cols = [f.proc_column for f in features]
+        return self.ds.map_batches(lambda df: to_scalar_df(df[feat_cols]), batch_size=None)
 
     def repartition(self, num_blocks: int):
         """Repartition the dataset into the specified number of blocks.
@@ -219,7 +298,28 @@ class RayDatasetManager(DatasetManager):
         training_set_metadata: TrainingSetMetadataDict,
         tag: str,
     ):
-        self.backend.df_engine.to_parquet(dataset, cache_path)
+        """Writes the processed dataset to `cache_path` as Parquet.
+
+        Fixed-shape array columns are cast to Ray's tensor extension type once here, when the blocks of the Ray
+        Dataset are created, so that the cached files are read back as tensor columns and `iter_batches` yields
+        contiguous arrays instead of stacking object columns of arrays for every batch of every epoch. Datasets with
+        columns that Ray fails to cast are written with the regular Parquet writer instead.
+        """
+        df_engine = self.backend.df_engine
+        try:
+            with tensor_extension_casting(True):
+                ds = df_engine.to_ray_dataset(dataset)
+                fs, path = get_fs_and_path(cache_path)
+                ds.write_parquet(
+                    path,
+                    filesystem=PyFileSystem(FSSpecHandler(fs)),
+                    **get_parquet_compression_kwargs(),
+                )
+        except ValueError as e:
+            logger.warning(f"Unable to write {tag} set with tensor columns, writing it without casting: {e}")
+            if path_exists(cache_path):
+                delete(cache_path, recursive=True)
+            df_engine.to_parquet(dataset, cache_path)
         return cache_path
 
     def can_cache(self, skip_save_processed_input):
@@ -237,10 +337,13 @@ class RayDatasetShard(Dataset):
         dataset_shard: DatasetPipeline,
         features: Dict[str, FeatureConfigDict],
         training_set_metadata: TrainingSetMetadataDict,
+        local_shuffle_buffer_size: Optional[int] = None,
     ):
         self.dataset_shard = dataset_shard
         self.features = features
         self.training_set_metadata = training_set_metadata
+        self.local_shuffle_buffer_size = local_shuffle_buffer_size
+        self._length: Optional[int] = None
         self.create_epoch_iter()
 
     def create_epoch_iter(self) -> None:
@@ -285,11 +388,14 @@ class RayDatasetShard(Dataset):
             self.size,
             ignore_last,
             augmentation_pipeline=augmentation_pipeline,
+            local_shuffle_buffer_size=self.local_shuffle_buffer_size if should_shuffle else None,
+            local_shuffle_seed=random_seed,
         )
 
-    @lru_cache(1)
     def __len__(self):
-        return next(self.epoch_iter).count()
+        if self._length is None:
+            self._length = next(self.epoch_iter).count()
+        return self._length
 
     @property
     def size(self):
@@ -314,10 +420,15 @@ class RayDatasetBatcher(Batcher):
         ignore_last: bool = False,
         # TODO: figure out correct typing for augmentation_pipeline after refactoring is done
         augmentation_pipeline=None,
+        local_shuffle_buffer_size: Optional[int] = None,
+        local_shuffle_seed: Optional[int] = None,
     ):
         self.dataset_epoch_iterator = dataset_epoch_iterator
+        self.local_shuffle_buffer_size = local_shuffle_buffer_size
+        self.local_shuffle_seed = local_shuffle_seed
         self.batch_size = batch_size
         self.samples_per_epoch = samples_per_epoch
+        self.steps_per_epoch = self._compute_steps_per_epoch()
         self.training_set_metadata = training_set_metadata
         self.ignore_last = ignore_last
         self.augmentation_pipeline = augmentation_pipeline
@@ -329,9 +440,23 @@ class RayDatasetBatcher(Batcher):
             proc_column: training_set_metadata[feature[NAME]].get("reshape")
             for proc_column, feature in features.items()
         }
+        # Per-column preparation functions, specialized once for the fixed feature schema so that preparing a batch
+        # does no per-column lookups or branching on features
+        self._column_preparers = [
+            (
+                c,
+                make_column_preparer(
+                    c,
+                    augmentation_pipeline[c] if augmentation_pipeline and c in augmentation_pipeline else None,
+                    self.reshape_map.get(c),
+                ),
+            )
+            for c in self.columns
+        ]
 
         self.dataset_batch_iter = None
         self._epoch = 0
+        self._epochs_fetched = 0
         self._next_batch = None
         self._last_batch = False
         self._step = 0
@@ -351,6 +476,7 @@ class RayDatasetBatcher(Batcher):
 
     def set_epoch(self, epoch, batch_size):
         self.batch_size = batch_size
+        self.steps_per_epoch = self._compute_steps_per_epoch()
         if epoch != self._epoch:
             self._fetch_next_epoch()
             self._epoch = epoch
@@ -359,12 +485,13 @@ class RayDatasetBatcher(Batcher):
     def step(self):
         return self._step
 
-    @property
-    def steps_per_epoch(self):
-        return math.ceil(self.samples_per_epoch / self.batch_size)
+    def _compute_steps_per_epoch(self) -> int:
+        # Integer ceiling division, avoiding float precision issues for very large datasets
+        return -(-self.samples_per_epoch // self.batch_size)
 
     def _fetch_next_epoch(self):
         pipeline = next(self.dataset_epoch_iterator)
+        self._epochs_fetched += 1
 
         read_parallelism = 1
         if read_parallelism == 1:
@@ -394,114 +521,110 @@ class RayDatasetBatcher(Batcher):
         except StopIteration:
             self._last_batch = True
 
-    def _prepare_batch(self, batch: pd.DataFrame) -> Dict[str, np.ndarray]:
-        res = {}
-        for c in self.columns:
-            if batch[c].values.dtype == "object":
-                # Ensure columns stacked instead of turned into np.array([np.array, ...], dtype=object) objects
-                res[c] = np.stack(batch[c].values)
-            else:
-                res[c] = batch[c].to_numpy()
-
-        for c in self.columns:
-            reshape = self.reshape_map.get(c)
-            if reshape is not None:
-                res[c] = res[c].reshape((-1, *reshape))
-        return res
-
-    def _augment_batch_fn(self):
-        augmentation_pipeline = self.augmentation_pipeline
-
-        def augment_batch(df: pd.DataFrame) -> pd.DataFrame:
-            # df is pandas dataframe, where each column is Series, to use data as arrays
-            # convert dataframe to dict of arrays
-            dict_of_arrays = to_numpy_dataset(df)
+    def _prepare_batch(self, batch: Dict[str, np.ndarray]) -> Dict[str, np.ndarray]:
+        """Converts a batch in Ray's numpy format into the dict of arrays consumed by the model.
 
-            if augmentation_pipeline:
-                for c, augmentations in augmentation_pipeline.items():
-                    # TODO: convert to debug message when done with development
-                    logger.info(f"RayDatasetBatcher applying augmentation pipeline to batch for feature {c}")
-
-                    # apply augmentation pipeline operations to the batch of np.array
-                    dict_of_arrays[c] = augmentations(torch.tensor(dict_of_arrays[c])).numpy()
-
-            # convert dict of arrays back to dataframe
-            df = from_numpy_dataset(dict_of_arrays)
-            return df
-
-        return augment_batch
+        Scalar and fixed-shape tensor columns already arrive as contiguous arrays from Ray, so only object columns need
+        to be stacked. Augmentation and reshaping are applied to each column in the same pass, so the batch is not
+        converted back and forth between formats in a separate pipeline stage.
+        """
+        return {c: prepare(batch[c]) for c, prepare in self._column_preparers}
+
+    def _iter_batches(self, pipeline: DatasetPipeline, batch_size: int, prefetch_blocks: int = 0):
+        """Iterates over numpy batches of the pipeline, shuffling within a local buffer if one is configured."""
+        local_shuffle_seed = None
+        if self.local_shuffle_seed is not None:
+            # Vary the seed across epochs so that each epoch sees a different order
+            local_shuffle_seed = self.local_shuffle_seed + self._epochs_fetched
+        return pipeline.iter_batches(
+            prefetch_blocks=prefetch_blocks,
+            batch_size=batch_size,
+            batch_format="numpy",
+            local_shuffle_buffer_size=self.local_shuffle_buffer_size,
+            local_shuffle_seed=local_shuffle_seed,
+        )
 
     def _create_sync_reader(self, pipeline: DatasetPipeline):
         def sync_read():
-            for batch in pipeline.iter_batches(prefetch_blocks=0, batch_size=self.batch_size, batch_format="pandas"):
+            for batch in self._iter_batches(pipeline, self.batch_size):
                 yield self._prepare_batch(batch)
 
         return sync_read()
 
     def _create_async_reader(self, pipeline: DatasetPipeline):
-        q = queue.Queue(maxsize=100)
         batch_size = self.batch_size
-        augment_batch = self._augment_batch_fn()
-
-        def producer():
-            nonlocal pipeline
-
-            try:
-                # if augmentation is specified, setup prefetching batch of data
-                if self.augmentation_pipeline:
-                    pipeline = pipeline.map_batches(augment_batch, batch_size=batch_size, batch_format="pandas")
-
-                for batch in pipeline.iter_batches(prefetch_blocks=0, batch_size=batch_size, batch_format="pandas"):
-                    res = self._prepare_batch(batch)
-                    q.put(res)
-                q.put(None)
-            except Exception as e:
-                # Ensure any exceptions raised in this background thread are raised on the main thread
-                q.put(e)
 
         def async_read():
-            t = threading.Thread(target=producer)
-            t.start()
-            while True:
-                batch = q.get(block=True)
-                if isinstance(batch, Exception):
-                    # Raise any exceptions from the producer thread
-                    raise batch
-                if batch is None:
-                    break
-                yield batch
-            t.join()
+            # Ray fetches the next blocks in the background while the current batches are consumed, so no
+            # producer thread is needed to overlap reading with training
+            for batch in self._iter_batches(pipeline, batch_size, prefetch_blocks=PREFETCH_BLOCKS):
+                yield self._prepare_batch(batch)
 
         return async_read()
 
     def _create_async_parallel_reader(self, pipeline: DatasetPipeline, num_threads: int):
-        q = queue.Queue(maxsize=100)
-
         batch_size = self.batch_size
 
         splits = pipeline.split(n=num_threads)
 
+        # Each producer fills its own bounded buffer guarded by its own condition, so producers never contend with
+        # each other for a lock and the consumer only synchronizes with the producer it is currently reading from.
+        buffers = [collections.deque() for _ in range(num_threads)]
+        conditions = [threading.Condition() for _ in range(num_threads)]
+        finished = [False] * num_threads
+        errors: List[Optional[BaseException]] = [None] * num_threads
+        stopped = threading.Event()
+
         def producer(i):
-            for batch in splits[i].iter_batches(prefetch_blocks=0, batch_size=batch_size, batch_format="pandas"):
-                res = self._prepare_batch(batch)
-                q.put(res)
-            q.put(None)
+            buffer, cond = buffers[i], conditions[i]
+            try:
+                for batch in self._iter_batches(splits[i], batch_size):
+                    res = self._prepare_batch(batch)
+                    with cond:
+                        cond.wait_for(lambda: len(buffer) < PARALLEL_READER_BUFFER_SIZE or stopped.is_set())
+                        if stopped.is_set():
+                            return
+                        buffer.append(res)
+                        cond.notify()
+            except BaseException as e:
+                errors[i] = e
+            finally:
+                # Always mark the producer as finished, so that the consumer never waits on a producer that died
+                with cond:
+                    finished[i] = True
+                    cond.notify()
 
         def async_parallel_read():
             threads = [threading.Thread(target=producer, args=(i,)) for i in range(num_threads)]
             for t in threads:
                 t.start()
 
-            active_threads = num_threads
-            while True:
-                batch = q.get(block=True)
-                if batch is None:
-                    active_threads -= 1
-                    if active_threads == 0:
-                        break
-                yield batch
-
-            for t in threads:
-                t.join()
+            try:
+                # Drain the producers round-robin, dropping each one once it is finished and its buffer is empty
+                active = list(range(num_threads))
+                pos = 0
+                while active:
+                    pos %= len(active)
+                    i = active[pos]
+                    buffer, cond = buffers[i], conditions[i]
+                    with cond:
+                        cond.wait_for(lambda: buffer or finished[i])
+                        if errors[i] is not None:
+                            raise errors[i]
+                        if not buffer:
+                            active.pop(pos)
+                            continue
+                        batch = buffer.popleft()
+                        cond.notify()
+                    yield batch
+                    pos += 1
+            finally:
+                # Release any producers still waiting for buffer space, e.g. when another producer failed
+                stopped.set()
+                for cond in conditions:
+                    with cond:
+                        cond.notify_all()
+                for t in threads:
+                    t.join()
 
         return async_parallel_read()
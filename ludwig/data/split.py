@@ -19,7 +19,7 @@ from typing import List, Optional, Tuple, TYPE_CHECKING
 from zlib import crc32
 
 import numpy as np
-from sklearn.model_selection import train_test_split
+import pandas as pd
 
 from ludwig.api_annotations import DeveloperAPI
 from ludwig.backend.base import Backend
@@ -113,12 +113,11 @@ class RandomSplitter(Splitter):
         probabilities = self.probabilities
         if not backend.df_engine.partitioned:
             divisions = _split_divisions_with_min_rows(len(df), probabilities)
-            shuffled_df = df.sample(frac=1, random_state=random_seed)
-            return (
-                shuffled_df.iloc[: divisions[0]],  # Train
-                shuffled_df.iloc[divisions[0] : divisions[1]],  # Validation
-                shuffled_df.iloc[divisions[1] :],  # Test
-            )
+            # Permute row positions rather than the frame itself, so each split copies only its own rows once
+            # instead of materializing a fully shuffled copy of the dataset first.
+            permutation = np.random.default_rng(random_seed).permutation(len(df))
+            train_idx, val_idx, test_idx = np.split(permutation, divisions)
+            return df.take(train_idx), df.take(val_idx), df.take(test_idx)
 
         # The above approach is very inefficient for partitioned backends, which can split by partition.
         # This does not give exact guarantees on split size but is much more efficient for large datasets.
@@ -154,6 +153,73 @@ class FixedSplitter(Splitter):
         return FixedSplitConfig
 
 
+def _apportion(counts: np.ndarray, total: int, rng: np.random.Generator) -> np.ndarray:
+    """Splits `total` rows across classes in proportion to their `counts` with the largest remainder method.
+
+    Every class gets the floor of its exact share, and the rows left over go to the classes with the largest
+    fractional parts, with ties broken at random, so the allocations always add up to `total`.
+    """
+    allocation = np.zeros(len(counts), dtype=np.int64)
+    if total == 0:
+        return allocation
+    exact = counts * (total / counts.sum())
+    allocation = np.minimum(np.floor(exact).astype(np.int64), counts)
+    leftover = total - allocation.sum()
+    if leftover > 0:
+        order = np.lexsort((rng.random(len(counts)), allocation - exact))
+        allocation[order[:leftover]] += 1
+    return allocation
+
+
+def _stratify_split_indices(
+    labels: np.ndarray, probabilities: List[float], random_seed: float
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Returns the sorted row positions of the train, validation, and test sets for a stratified split of labels.
+
+    The size of each split is rounded over the whole dataset and then apportioned across classes, rather than rounded
+    for every class, so datasets with many small classes still get splits of the requested sizes.
+    """
+    frac_train, frac_val, _ = probabilities
+    rng = np.random.default_rng(random_seed)
+
+    # Group row positions by class with a single stable sort, then carve each shuffled group into three disjoint
+    # ranges so every row is assigned exactly once.
+    codes, _ = pd.factorize(labels)
+    order = np.argsort(codes, kind="stable")
+    _, group_starts = np.unique(codes[order], return_index=True)
+    groups = np.split(order, group_starts[1:])
+
+    # Round the cumulative boundaries, so float drift such as (0.7 + 0.2) * 10 < 9 does not move a boundary.
+    num_train = int(round(frac_train * len(labels)))
+    num_val = int(round((frac_train + frac_val) * len(labels))) - num_train
+
+    # Classes with a single example cannot be stratified, so they are kept in the training set and count towards it.
+    counts = np.array([len(group) for group in groups], dtype=np.int64)
+    stratified = counts > 1
+    train_counts = np.where(stratified, 0, counts)
+    num_stratified = counts[stratified].sum()
+    train_counts[stratified] = _apportion(
+        counts[stratified], min(max(num_train - train_counts.sum(), 0), num_stratified), rng
+    )
+    remaining_counts = counts - train_counts
+    val_counts = np.zeros_like(counts)
+    val_counts[stratified] = _apportion(
+        remaining_counts[stratified], min(num_val, remaining_counts[stratified].sum()), rng
+    )
+
+    train_idx, val_idx, test_idx = [], [], []
+    for group, train_end, val_end in zip(groups, train_counts, train_counts + val_counts):
+        rng.shuffle(group)
+        train_idx.append(group[:train_end])
+        val_idx.append(group[train_end:val_end])
+        test_idx.append(group[val_end:])
+
+    # Sort positions so each split keeps the original row order.
+    return tuple(
+        np.sort(np.concatenate(idx)) if idx else np.empty(0, dtype=np.int64) for idx in (train_idx, val_idx, test_idx)
+    )
+
+
 def stratify_split_dataframe(
     df: DataFrame, column: str, probabilities: List[float], backend: Backend, random_seed: float
 ) -> Tuple[DataFrame, DataFrame, DataFrame]:
@@ -162,30 +228,8 @@ def stratify_split_dataframe(
     The column must be categorical (including binary). The split is stratified, meaning that the proportion of each
     category in each split is the same as in the original dataset.
     """
-
-    frac_train, frac_val, frac_test = probabilities
-
-    def _safe_stratify(df, column, test_size):
-        # Get the examples with cardinality of 1
-        df_cadinalities = df.groupby(column)[column].size()
-        low_cardinality_elems = df_cadinalities.loc[lambda x: x == 1]
-        df_low_card = df[df[column].isin(low_cardinality_elems.index)]
-        df = df[~df[column].isin(low_cardinality_elems.index)]
-        y = df[[column]]
-
-        df_train, df_temp, _, _ = train_test_split(df, y, stratify=y, test_size=test_size, random_state=random_seed)
-
-        # concat the examples with cardinality of 1 to the training DF.
-        if len(df_low_card.index) > 0:
-            df_train = backend.df_engine.concat([df_train, df_low_card])
-
-        return df_train, df_temp
-
-    df_train, df_temp = _safe_stratify(df, column, 1.0 - frac_train)
-
-    relative_frac_test = frac_test / (frac_val + frac_test)
-    df_val, df_test = _safe_stratify(df_temp, column, relative_frac_test)
-
+    split_indices = _stratify_split_indices(df[column].to_numpy(), probabilities, random_seed)
+    df_train, df_val, df_test = (df.take(idx) for idx in split_indices)
     return df_train, df_val, df_test
 
 
@@ -207,16 +251,19 @@ class StratifySplitter(Splitter):
         def split_partition(partition: DataFrame) -> DataFrame:
             """Splits a single partition into train, val, test.
 
-            Returns a single DataFrame with the split column populated. Assumes that the split column is already present
-            in the partition and has a default value of 0 (train).
+            Returns a single DataFrame with the int8 split column populated, where 0 is train, 1 is val and 2 is test.
             """
-            _, val, test = stratify_split_dataframe(partition, self.column, self.probabilities, backend, random_seed)
+            _, val_idx, test_idx = _stratify_split_indices(
+                partition[self.column].to_numpy(), self.probabilities, random_seed
+            )
             # Split column defaults to train, so only need to update val and test
-            partition.loc[val.index, TMP_SPLIT_COL] = 1
-            partition.loc[test.index, TMP_SPLIT_COL] = 2
+            splits = np.zeros(len(partition), dtype=np.int8)
+            splits[val_idx] = 1
+            splits[test_idx] = 2
+            partition[TMP_SPLIT_COL] = splits
             return partition
 
-        df[TMP_SPLIT_COL] = 0
+        df = df.assign(**{TMP_SPLIT_COL: 0}).astype({TMP_SPLIT_COL: np.int8})
         df = backend.df_engine.map_partitions(df, split_partition, meta=df)
 
         df_train = df[df[TMP_SPLIT_COL] == 0].drop(columns=TMP_SPLIT_COL)
@@ -248,6 +295,38 @@ class StratifySplitter(Splitter):
         return StratifySplitConfig
 
 
+def _is_date_vector_column(column: pd.Series) -> bool:
+    """Returns True if the column appears to hold date vectors as produced by Ludwig's date feature preprocessing.
+
+    Only the first row is inspected, so callers must handle conversion errors caused by later rows.
+    """
+    if column.dtype != object or len(column) == 0:
+        return False
+    first = column.iloc[0]
+    return isinstance(first, (list, np.ndarray)) and len(first) == 9
+
+
+def _date_vectors_to_datetime(column: pd.Series) -> pd.Series:
+    """Converts a column of date vectors into datetimes in a single vectorized pass.
+
+    Date vectors are laid out as [year, month, day, weekday, yearday, hour, minute, second, second_of_day].
+    """
+    vectors = np.asarray(column.tolist(), dtype=np.int32)
+    return pd.to_datetime(
+        pd.DataFrame(
+            {
+                "year": vectors[:, 0],
+                "month": vectors[:, 1],
+                "day": vectors[:, 2],
+                "hour": vectors[:, 5],
+                "minute": vectors[:, 6],
+                "second": vectors[:, 7],
+            },
+            index=column.index,
+        )
+    )
+
+
 @split_registry.register("datetime")
 class DatetimeSplitter(Splitter):
     def __init__(
@@ -280,11 +359,23 @@ class DatetimeSplitter(Splitter):
 
             return f"{x[0]}-{x[1]}-{x[2]} {x[5]}:{x[6]}:{x[7]}"
 
-        df[TMP_SPLIT_COL] = backend.df_engine.map_objects(df[self.column], list_to_date_str)
+        column = df[self.column]
+        dates = None
+        if pd.api.types.is_datetime64_any_dtype(column.dtype):
+            # Already parsed as datetimes, so there is no need to round trip through strings
+            dates = column
+        elif not backend.df_engine.partitioned and _is_date_vector_column(column):
+            try:
+                dates = _date_vectors_to_datetime(column)
+            except (TypeError, ValueError):
+                # Only the first row is checked, so later missing values or other types fall back to the per-row path
+                pass
+        if dates is None:
+            dates = backend.df_engine.df_lib.to_datetime(backend.df_engine.map_objects(column, list_to_date_str))
 
         # Convert datetime to int64 to workaround Dask limitation
         # https://github.com/dask/dask/issues/9003
-        df[TMP_SPLIT_COL] = backend.df_engine.df_lib.to_datetime(df[TMP_SPLIT_COL]).values.astype("int64")
+        df[TMP_SPLIT_COL] = dates.values.astype("int64")
 
         # Sort by ascending datetime and drop the temporary column
         df = df.sort_values(TMP_SPLIT_COL).drop(columns=TMP_SPLIT_COL)
@@ -310,7 +310,10 @@ def get_buffer(dataset_name: str, kaggle_username: str = None, kaggle_key: str =
             dataset = get_dataset("hugging_face").load(hf_id, hf_subsample)
         else:
             dataset = get_dataset(dataset_name).load(kaggle_username=kaggle_username, kaggle_key=kaggle_key)
-        buffer = BytesIO(dataset.to_parquet())
+        # Serialize directly into the buffer rather than copying a fully materialized bytes object into it.
+        buffer = BytesIO()
+        dataset.to_parquet(buffer)
+        buffer.seek(0)
         return buffer
     except Exception as e:
         logging.error(logging.ERROR, f"Failed to upload dataset {dataset_name}: {e}")
@@ -26,6 +26,9 @@ from ludwig.utils.fs_utils import upload_output_directory
 
 logger = logging.getLogger(__name__)
 
+# Size of the buffer used when decompressing archive contents to disk.
+EXTRACT_CHUNK_SIZE = 1024 * 1024
+
 
 class ArchiveType(str, Enum):
     """The type of file archive."""
@@ -88,6 +91,15 @@ def list_archive(archive_path, archive_type: Optional[ArchiveType] = None) -> Li
     return []
 
 
+def _is_within_directory(directory: str, target: str) -> bool:
+    abs_directory = os.path.abspath(directory)
+    abs_target = os.path.abspath(target)
+
+    prefix = os.path.commonprefix([abs_directory, abs_target])
+
+    return prefix == abs_directory
+
+
 def extract_archive(archive_path: str, archive_type: Optional[ArchiveType] = None) -> List[str]:
     """Extracts files from archive (into the same directory), returns a list of extracted files.
 
@@ -114,27 +126,15 @@ def extract_archive(archive_path: str, archive_type: Optional[ArchiveType] = Non
             gzip_content_file = ".".join(archive_path.split(".")[:-1])  # Path minus the .gz extension
             with gzip.open(archive_path) as gzfile:
                 with open(os.path.join(tmpdir, gzip_content_file), "wb") as output:
-                    shutil.copyfileobj(gzfile, output)
+                    shutil.copyfileobj(gzfile, output, EXTRACT_CHUNK_SIZE)
         elif archive_type in {ArchiveType.TAR, ArchiveType.TAR_ZIP, ArchiveType.TAR_BZ2, ArchiveType.TAR_GZ}:
-            with tarfile.open(archive_path) as tar_file:
-
-                def is_within_directory(directory, target):
-                    abs_directory = os.path.abspath(directory)
-                    abs_target = os.path.abspath(target)
-
-                    prefix = os.path.commonprefix([abs_directory, abs_target])
-
-                    return prefix == abs_directory
-
-                def safe_extract(tar, path=".", members=None, *, numeric_owner=False):
-                    for member in tar.getmembers():
-                        member_path = os.path.join(path, member.name)
-                        if not is_within_directory(path, member_path):
-                            raise Exception("Attempted Path Traversal in Tar File")
-
-                    tar.extractall(path, members, numeric_owner=numeric_owner)
-
-                safe_extract(tar_file, path=tmpdir)
+            # Open the archive in streaming mode so that it is decompressed and extracted in a single sequential
+            # pass, rather than reading all members up front and then decompressing the archive again to extract.
+            with tarfile.open(archive_path, mode="r|*") as tar_file:
+                for member in tar_file:
+                    if not _is_within_directory(tmpdir, os.path.join(tmpdir, member.name)):
+                        raise Exception("Attempted Path Traversal in Tar File")
+                    tar_file.extract(member, tmpdir)
         else:
             logger.error(f"Unsupported archive: {archive_path}")
     directory_contents_after = set(os.listdir(archive_directory))
@@ -23,6 +23,21 @@ def update_env(**kwargs):
         os.environ = old
 
 
+def authenticate_kaggle_client(api, kaggle_username: Optional[str] = None, kaggle_key: Optional[str] = None):
+    """Authenticates the kaggle client, unless it was already authenticated with the same credentials.
+
+    The kaggle client is a process-wide singleton, so skipping redundant authentication lets consecutive downloads
+    reuse its HTTP connection pool instead of re-reading credentials before every download.
+    """
+    credentials = (kaggle_username, kaggle_key)
+    if getattr(api, "_ludwig_credentials", None) == credentials:
+        return
+    with update_env(KAGGLE_USERNAME=kaggle_username, KAGGLE_KEY=kaggle_key):
+        # Call authenticate explicitly to pick up new credentials if necessary
+        api.authenticate()
+    api._ludwig_credentials = credentials
+
+
 def download_kaggle_dataset(
     download_directory: str,
     kaggle_dataset_id: Optional[str] = None,
@@ -36,9 +51,9 @@ def download_kaggle_dataset(
     perform authentication.
     """
     with update_env(KAGGLE_USERNAME=kaggle_username, KAGGLE_KEY=kaggle_key):
-        # Call authenticate explicitly to pick up new credentials if necessary
+        # Importing the kaggle client authenticates it, so credentials must already be in the environment
         api = create_kaggle_client()
-        api.authenticate()
+    authenticate_kaggle_client(api, kaggle_username=kaggle_username, kaggle_key=kaggle_key)
     with upload_output_directory(download_directory) as (tmpdir, _):
         if kaggle_competition:
             api.competition_download_files(kaggle_competition, path=tmpdir)
@@ -14,16 +14,25 @@
 # ==============================================================================
 from __future__ import annotations
 
+import functools
 import glob
 import hashlib
+import json
 import logging
 import os
 import shutil
+import threading
 import urllib
+from concurrent.futures import ThreadPoolExecutor
 from enum import Enum
 from urllib.parse import urlparse
 
+import numpy as np
 import pandas as pd
+import pyarrow as pa
+import pyarrow.csv as pacsv
+import pyarrow.dataset as pads
+import requests
 from tqdm import tqdm
 
 from ludwig.api_annotations import DeveloperAPI, PublicAPI
@@ -32,11 +41,53 @@ from ludwig.datasets.archives import extract_archive, is_archive, list_archive
 from ludwig.datasets.dataset_config import DatasetConfig, DatasetFallbackMirror
 from ludwig.datasets.kaggle import download_kaggle_dataset
 from ludwig.datasets.utils import model_configs_for_dataset
+from ludwig.globals import LUDWIG_VERSION
 from ludwig.utils.fs_utils import get_default_cache_location, get_fs_and_path
 from ludwig.utils.strings_utils import make_safe_filename
 
 logger = logging.getLogger(__name__)
 
+# Maximum number of dataset files downloaded concurrently.
+MAX_DOWNLOAD_WORKERS = 8
+DOWNLOAD_CHUNK_SIZE = 1024 * 1024
+DOWNLOAD_TIMEOUT_SECONDS = 60
+
+# requests.Session is not thread-safe, so each download worker thread reuses its own session and connection pool.
+_thread_local = threading.local()
+
+
+def _get_http_session() -> requests.Session:
+    if not hasattr(_thread_local, "http_session"):
+        _thread_local.http_session = requests.Session()
+    return _thread_local.http_session
+
+
+# Strings pandas.read_csv parses as missing values by default. pyarrow's defaults omit some of them.
+CSV_NULL_VALUES = [
+    "",
+    "#N/A",
+    "#N/A N/A",
+    "#NA",
+    "-1.#IND",
+    "-1.#QNAN",
+    "-NaN",
+    "-nan",
+    "1.#IND",
+    "1.#QNAN",
+    "<NA>",
+    "N/A",
+    "NA",
+    "NULL",
+    "NaN",
+    "None",
+    "n/a",
+    "nan",
+    "null",
+]
+
+# Records the raw files a processed dataset was built from, stored alongside the processed dataset.
+PROCESSED_MANIFEST_FILENAME = ".ludwig_manifest.json"
+
 
 @DeveloperAPI
 class TqdmUpTo(tqdm):
@@ -74,14 +125,141 @@ def _glob_multiple(pathnames: list[str], root_dir: str = None, recursive: bool =
     return set().union(*[glob.glob(p, recursive=recursive) for p in pathnames])
 
 
-def _sha256_digest(file_path) -> str:
-    """Returns the sha256 digest for the specified file."""
-    hash = hashlib.sha256()
+def _concat_dataframes(dataframes: list[pd.DataFrame]) -> pd.DataFrame:
+    """Concatenates dataframes with a new range index.
+
+    Most datasets are loaded from a single file per split, so a lone dataframe is re-indexed in place rather than
+    copied by pd.concat, which would otherwise hold two copies of the dataset in memory at once.
+    """
+    if len(dataframes) == 1:
+        dataframe = dataframes[0]
+        dataframe.index = pd.RangeIndex(len(dataframe))
+        return dataframe
+    return pd.concat(dataframes, ignore_index=True)
+
+
+def _read_csv(file_path: str, sep: str = ",") -> pd.DataFrame:
+    """Reads a delimited text file using pyarrow's multithreaded CSV reader.
+
+    Falls back to pandas.read_csv whenever pyarrow fails to parse the file, or infers columns pandas would load
+    differently (temporal, all-null or non-utf8 columns, boolean columns with missing values, duplicate or blank column
+    names), so the resulting dataframe is the same either way.
+    """
+    try:
+        table = pacsv.read_csv(
+            file_path,
+            read_options=pacsv.ReadOptions(use_threads=True),
+            parse_options=pacsv.ParseOptions(delimiter=sep, newlines_in_values=True),
+            convert_options=pacsv.ConvertOptions(null_values=CSV_NULL_VALUES, strings_can_be_null=True),
+        )
+    except (pa.ArrowInvalid, pa.ArrowNotImplementedError):
+        return pd.read_csv(file_path, sep=sep)
+
+    column_names = table.column_names
+    if len(set(column_names)) != len(column_names) or "" in column_names:
+        return pd.read_csv(file_path, sep=sep)
+    for column in table.columns:
+        if (
+            pa.types.is_temporal(column.type)
+            or pa.types.is_null(column.type)
+            or pa.types.is_binary(column.type)
+            or (pa.types.is_boolean(column.type) and column.null_count > 0)
+        ):
+            return pd.read_csv(file_path, sep=sep)
+
+    # pyarrow represents missing strings as None, pandas as NaN.
+    string_columns_with_nulls = [
+        name
+        for name, column in zip(column_names, table.columns)
+        if pa.types.is_string(column.type) and column.null_count
+    ]
+    df = table.to_pandas(split_blocks=True, self_destruct=True)
+    for column_name in string_columns_with_nulls:
+        df[column_name] = df[column_name].where(df[column_name].notna(), np.nan)
+    return df
+
+
+def _download_file(url: str, file_path: str, position: int = 0) -> str | None:
+    """Downloads url to file_path, reporting progress on its own progress bar line.
+
+    HTTP(S) downloads share a single session so connections are reused across files, and a partially downloaded file
+    left behind by an earlier attempt is resumed with a range request instead of being downloaded again. The sha256
+    digest of HTTP(S) downloads is computed while the data is streamed to disk and returned, so the file does not need
+    to be read again to verify it. Returns None if the digest was not computed.
+    """
+    filename = os.path.basename(file_path)
+    if urlparse(url).scheme not in {"http", "https"}:
+        with TqdmUpTo(unit="B", unit_scale=True, unit_divisor=1024, miniters=1, desc=filename, position=position) as t:
+            urllib.request.urlretrieve(url, file_path, t.update_to)
+        return None
+
+    offset = os.path.getsize(file_path) if os.path.exists(file_path) else 0
+    # Request the file as stored so that byte ranges and sizes refer to the file itself, as with urlretrieve.
+    headers = {"Accept-Encoding": "identity"}
+    if offset:
+        headers["Range"] = f"bytes={offset}-"
+    with _get_http_session().get(url, stream=True, headers=headers, timeout=DOWNLOAD_TIMEOUT_SECONDS) as response:
+        if offset and response.status_code == 416:
+            # Requested range starts at the end of the file, so the previous download was already complete.
+            return None
+        response.raise_for_status()
+        if response.status_code != 206:
+            # The server ignored the range request and is sending the whole file.
+            offset = 0
+        hash = hashlib.sha256()
+        if offset:
+            _update_hash_from_file(hash, file_path)
+        content_length = int(response.headers.get("Content-Length", 0))
+        with open(file_path, "ab" if offset else "wb") as f, tqdm(
+            total=offset + content_length if content_length else None,
+            initial=offset,
+            unit="B",
+            unit_scale=True,
+            unit_divisor=1024,
+            miniters=1,
+            desc=filename,
+            position=position,
+        ) as t:
+            for chunk in response.iter_content(chunk_size=DOWNLOAD_CHUNK_SIZE):
+                f.write(chunk)
+                hash.update(chunk)
+                t.update(len(chunk))
+    return hash.hexdigest()
+
+
+def _update_hash_from_file(hash, file_path: str) -> None:
     buffer = bytearray(hash.block_size * 1024)  # Attempts to read in multiples of the hash block size (64KB).
     mv = memoryview(buffer)
     with open(file_path, "rb", buffering=0) as f:
         for bytes_read in iter(lambda: f.readinto(mv), 0):
             hash.update(mv[:bytes_read])
+
+
+def _sha256_digest(file_path) -> str:
+    """Returns the sha256 digest for the specified file."""
+    hash = hashlib.sha256()
+    _update_hash_from_file(hash, file_path)
+    return hash.hexdigest()
+
+
+def _directory_fingerprint(root_dir: str) -> str:
+    """Returns a digest of the relative path, size and modification time of every file under root_dir.
+
+    Only file metadata is read, so computing the fingerprint does not scale with the size of the files.
+    """
+    entries = []
+    pending = [root_dir]
+    while pending:
+        with os.scandir(pending.pop()) as it:
+            for entry in it:
+                if entry.is_dir(follow_symlinks=False):
+                    pending.append(entry.path)
+                else:
+                    stat = entry.stat()
+                    entries.append((os.path.relpath(entry.path, root_dir), stat.st_size, stat.st_mtime_ns))
+    hash = hashlib.blake2b(digest_size=20)
+    for relative_path, size, mtime_ns in sorted(entries):
+        hash.update(f"{relative_path}\0{size}\0{mtime_ns}\n".encode())
     return hash.hexdigest()
 
 
@@ -122,6 +300,10 @@ class DatasetLoader:
         """Constructor."""
         self.config = config
         self.cache_dir = cache_dir if cache_dir else get_default_cache_location()
+        # Contents of downloaded archives keyed by path, size and modification time, see _list_archive.
+        self._archive_contents = {}
+        # sha256 digests of raw files keyed by path, size and modification time, see _file_digest.
+        self._file_digests = {}
 
     @property
     def name(self):
@@ -167,19 +349,29 @@ class DatasetLoader:
         """Save path for processed temp data."""
         return os.path.join(self.download_dir, "_processed")
 
+    @property
+    def processed_manifest_path(self) -> str:
+        """Save path for the manifest describing the raw files the processed dataset was built from."""
+        return os.path.join(self.processed_dataset_dir, PROCESSED_MANIFEST_FILENAME)
+
     @property
     def state(self) -> DatasetState:
         """Dataset state."""
-        if os.path.exists(self.processed_dataset_path):
+        if os.path.exists(self.processed_dataset_path) and not self._is_processed_dataset_stale():
             return DatasetState.TRANSFORMED
         if all([os.path.exists(os.path.join(self.raw_dataset_dir, filename)) for filename in self.download_filenames]):
             archive_filenames = [f for f in self.download_filenames if is_archive(f)]
             if archive_filenames:
-                # Check to see if archive has been extracted.
+                # Check to see if archive has been extracted. Preserved paths may already have been moved into the
+                # processed directory by an earlier, interrupted transform, which does not require extracting again.
                 extracted_files = [
-                    f for a in archive_filenames for f in list_archive(os.path.join(self.raw_dataset_dir, a))
+                    f for a in archive_filenames for f in self._list_archive(os.path.join(self.raw_dataset_dir, a))
                 ]
-                if all(os.path.exists(os.path.join(self.raw_dataset_dir, ef)) for ef in extracted_files):
+                if all(
+                    os.path.exists(os.path.join(self.raw_dataset_dir, ef))
+                    or os.path.exists(os.path.join(self.processed_dataset_dir, ef))
+                    for ef in extracted_files
+                ):
                     return DatasetState.EXTRACTED
                 else:
                     return DatasetState.DOWNLOADED
@@ -187,11 +379,34 @@ class DatasetLoader:
             return DatasetState.EXTRACTED
         return DatasetState.NOT_LOADED
 
-    @property
+    def _list_archive(self, archive_path: str) -> list[str]:
+        """Lists the files in an archive, reusing the listing until the archive changes.
+
+        The dataset state is checked several times while loading, and listing a tar archive decompresses all of it.
+        """
+        stat = os.stat(archive_path)
+        key = (archive_path, stat.st_size, stat.st_mtime_ns)
+        if key not in self._archive_contents:
+            self._archive_contents[key] = list_archive(archive_path)
+        return self._archive_contents[key]
+
+    def _file_digest(self, file_path: str) -> str:
+        """Returns the sha256 digest of a raw file, reusing a known digest if the file did not change since."""
+        stat = os.stat(file_path)
+        key = (file_path, stat.st_size, stat.st_mtime_ns)
+        if key not in self._file_digests:
+            self._file_digests[key] = _sha256_digest(file_path)
+        return self._file_digests[key]
+
+    def _record_file_digest(self, file_path: str, digest: str) -> None:
+        stat = os.stat(file_path)
+        self._file_digests[(file_path, stat.st_size, stat.st_mtime_ns)] = digest
+
+    @functools.cached_property
     def download_urls(self) -> list[str]:
         return _list_of_strings(self.config.download_urls)
 
-    @property
+    @functools.cached_property
     def download_filenames(self) -> list[str]:
         """Filenames for downloaded files inferred from download_urls."""
         if self.config.archive_filenames:
@@ -286,8 +501,12 @@ class DatasetLoader:
                 logger.exception("Failed to transform dataset")
 
     def load(
-        self, kaggle_username: str | None = None, kaggle_key: str | None = None, split: bool = False
-    ) -> pd.DataFrame | list[pd.DataFrame, pd.DataFrame, pd.DataFrame]:
+        self,
+        kaggle_username: str | None = None,
+        kaggle_key: str | None = None,
+        split: bool = False,
+        lazy: bool = False,
+    ) -> pd.DataFrame | list[pd.DataFrame, pd.DataFrame, pd.DataFrame] | pads.Dataset:
         """Loads the dataset, downloaded and processing it if needed.
 
         Note: This method is also responsible for splitting the data, returning a single dataframe if split=False, and a
@@ -297,9 +516,15 @@ class DatasetLoader:
         :param kaggle_key: (str) dataset key on Kaggle platform
         :param split: (bool) splits dataset along 'split' column if present. The split column should always have values
             0: train, 1: validation, 2: test.
+        :param lazy: (bool) returns a pyarrow dataset backed by the processed parquet file instead of a dataframe, so
+            that only the columns and rows which are read from it are loaded into memory. Cannot be combined with split.
         """
+        if lazy and split:
+            raise ValueError("Lazily loaded datasets cannot be split, filter the returned dataset on its split column.")
         self._download_and_process(kaggle_username=kaggle_username, kaggle_key=kaggle_key)
         if self.state == DatasetState.TRANSFORMED:
+            if lazy:
+                return pads.dataset(self.processed_dataset_path, format="parquet")
             dataset_df = self.load_transformed_dataset()
             if split:
                 return self.split(dataset_df)
@@ -318,10 +543,18 @@ class DatasetLoader:
                 kaggle_key=kaggle_key,
             )
         else:
-            for url, filename in zip(self.download_urls, self.download_filenames):
-                downloaded_file_path = os.path.join(self.raw_dataset_dir, filename)
-                with TqdmUpTo(unit="B", unit_scale=True, unit_divisor=1024, miniters=1, desc=filename) as t:
-                    urllib.request.urlretrieve(url, downloaded_file_path, t.update_to)
+            downloads = list(zip(self.download_urls, self.download_filenames))
+            # Downloads are network bound and independent of each other, so fetch them concurrently.
+            with ThreadPoolExecutor(max_workers=min(MAX_DOWNLOAD_WORKERS, len(downloads) or 1)) as executor:
+                file_paths = [os.path.join(self.raw_dataset_dir, filename) for _, filename in downloads]
+                futures = [
+                    executor.submit(_download_file, url, file_path, position=i)
+                    for i, ((url, _), file_path) in enumerate(zip(downloads, file_paths))
+                ]
+                for file_path, future in zip(file_paths, futures):
+                    digest = future.result()
+                    if digest is not None:
+                        self._record_file_digest(file_path, digest)
 
     def download_from_fallback_mirrors(self):
         for mirror in self.config.fallback_mirrors:
@@ -340,8 +573,9 @@ class DatasetLoader:
 
     def verify(self) -> None:
         """Verifies checksums for dataset."""
+        self._load_manifest_digests()
         for filename, sha256sum in self.config.sha256.items():
-            digest = _sha256_digest(os.path.join(self.raw_dataset_dir, filename))
+            digest = self._file_digest(os.path.join(self.raw_dataset_dir, filename))
             if digest != sha256sum:
                 raise ValueError(f"Checksum mismatch for file {filename} of {self.config.name} dataset")
         if not self.config.sha256:
@@ -350,7 +584,7 @@ class DatasetLoader:
             for filename in os.listdir(self.raw_dataset_dir):
                 path = os.path.join(self.raw_dataset_dir, filename)
                 if not os.path.isdir(path):
-                    digest = _sha256_digest(path)
+                    digest = self._file_digest(path)
                     logger.info(f"    {filename}: {digest}")
 
     def extract(self) -> list[str]:
@@ -389,11 +623,13 @@ class DatasetLoader:
         if not os.path.exists(self.processed_dataset_dir):
             os.makedirs(self.processed_dataset_dir)
         # Moves any preserved paths (ex. image directories) into processed directory to avoid unnecessary copy.
+        # shutil.move renames in place and only falls back to copying if the directories are on different devices.
         for rel_path in self._get_preserved_paths(self.raw_dataset_dir):
             source_path = os.path.join(self.raw_dataset_dir, rel_path)
             dest_path = os.path.join(self.processed_dataset_dir, rel_path)
             if os.path.exists(source_path) and not os.path.exists(dest_path):
-                os.replace(source_path, dest_path)
+                os.makedirs(os.path.dirname(dest_path), exist_ok=True)
+                shutil.move(source_path, dest_path)
         return data_files
 
     def load_file_to_dataframe(self, file_path: str) -> pd.DataFrame:
@@ -407,9 +643,9 @@ class DatasetLoader:
         elif file_extension == ".jsonl":
             return pd.read_json(file_path, lines=True)
         elif file_extension == ".tsv":
-            return pd.read_table(file_path)
+            return _read_csv(file_path, sep="\t")
         elif file_extension in {".csv", ".data"}:
-            return pd.read_csv(file_path)
+            return _read_csv(file_path)
         elif file_extension in {".parquet", ".pq", ".pqt"}:
             return pd.read_parquet(file_path)
         else:
@@ -437,13 +673,15 @@ class DatasetLoader:
                     # then the dataframe likely has an extra column that we don't want - i.e. "Unnamed: 0".
                     if len(column_names) != len(df.columns):
                         df = df[column_names]
-                    set_cols_dfs.append(df.set_axis(column_names, axis=1))
-                return pd.concat(set_cols_dfs, ignore_index=True)
+                    # Rename the columns in place, set_axis would copy all of the data just to change the labels.
+                    df.columns = column_names
+                    set_cols_dfs.append(df)
+                return _concat_dataframes(set_cols_dfs)
             else:
-                return pd.concat(dataframes, ignore_index=True)
+                return _concat_dataframes(dataframes)
         except ValueError as e:
             logger.warning(f"Error setting column names: {e}")
-            return pd.concat(dataframes, ignore_index=True)
+            return _concat_dataframes(dataframes)
 
     def load_unprocessed_dataframe(self, file_paths: list[str]) -> pd.DataFrame:
         """Load dataset files into a dataframe.
@@ -463,7 +701,7 @@ class DatasetLoader:
             dataframes = self._get_dataframe_with_fixed_splits(
                 train_paths, validation_paths, test_paths, dataset_paths, file_paths
             )
-        return pd.concat(dataframes, ignore_index=True)
+        return _concat_dataframes(dataframes)
 
     def _get_dataframe_with_fixed_splits_from_hf(self):
         dataframes = []
@@ -475,23 +713,24 @@ class DatasetLoader:
             if split_type in data_dict:
                 # We don't have to do anything if split not in data_dict because we just concatenate the dataframes
                 # in the end anyway.
-                data_dict[split_type][SPLIT] = splits.index(split_type)  # Add "split" column (0, 1, or 2)
+                data_dict[split_type][SPLIT] = np.int8(splits.index(split_type))  # Add "split" column (0, 1, or 2)
                 dataframes.append(data_dict[split_type])
         return dataframes
 
     def _get_dataframe_with_fixed_splits(self, train_paths, validation_paths, test_paths, dataset_paths, file_paths):
+        # Split columns only hold 0, 1 or 2, so they are stored as int8 rather than 8 byte integers.
         dataframes = []
         if len(train_paths) > 0:
             train_df = self.load_files_to_dataframe(train_paths)
-            train_df[SPLIT] = 0
+            train_df[SPLIT] = np.int8(0)
             dataframes.append(train_df)
         if len(validation_paths) > 0:
             validation_df = self.load_files_to_dataframe(validation_paths)
-            validation_df[SPLIT] = 1
+            validation_df[SPLIT] = np.int8(1)
             dataframes.append(validation_df)
         if len(test_paths) > 0:
             test_df = self.load_files_to_dataframe(test_paths)
-            test_df[SPLIT] = 2
+            test_df[SPLIT] = np.int8(2)
             dataframes.append(test_df)
         # If we have neither train/validation/test files nor dataset_paths in the config,
         # use data files in root dir.
@@ -514,11 +753,76 @@ class DatasetLoader:
         """Saves transformed dataframe as a flat file ludwig can load for training."""
         if not os.path.exists(self.processed_dataset_dir):
             os.makedirs(self.processed_dataset_dir)
-        dataframe.to_parquet(self.processed_dataset_path, engine="pyarrow")
+        # Write to a temporary file first so that an interrupted save never leaves behind a partial processed dataset,
+        # which would otherwise be mistaken for a transformed dataset on the next load.
+        # The index is not part of the dataset, loaders which filter rows would otherwise store it as an extra column.
+        temp_path = f"{self.processed_dataset_path}.tmp"
+        dataframe.to_parquet(temp_path, engine="pyarrow", index=False)
+        os.replace(temp_path, self.processed_dataset_path)
+        self._write_processed_manifest()
+
+    def _processed_manifest(self) -> dict:
+        return {"ludwig_version": LUDWIG_VERSION, "raw_fingerprint": _directory_fingerprint(self.raw_dataset_dir)}
+
+    def _write_processed_manifest(self) -> None:
+        """Records the raw files the processed dataset was built from, replacing any previous manifest atomically.
+
+        Digests of raw files verified in this session are recorded too, so later sessions can verify unchanged raw files
+        without reading them again.
+        """
+        if not os.path.isdir(self.raw_dataset_dir):
+            return
+        manifest = self._processed_manifest()
+        manifest["sha256"] = {}
+        for (file_path, size, mtime_ns), digest in self._file_digests.items():
+            if os.path.dirname(file_path) != self.raw_dataset_dir or not os.path.exists(file_path):
+                continue
+            stat = os.stat(file_path)
+            if (stat.st_size, stat.st_mtime_ns) == (size, mtime_ns):
+                manifest["sha256"][os.path.basename(file_path)] = digest
+        temp_path = f"{self.processed_manifest_path}.tmp"
+        with open(temp_path, "w") as f:
+            json.dump(manifest, f)
+        os.replace(temp_path, self.processed_manifest_path)
+
+    def _read_processed_manifest(self) -> dict | None:
+        if not os.path.exists(self.processed_manifest_path) or not os.path.isdir(self.raw_dataset_dir):
+            return None
+        try:
+            with open(self.processed_manifest_path) as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return None
+
+    def _load_manifest_digests(self) -> None:
+        """Reuses raw file digests recorded in the manifest, if the raw files did not change since it was written."""
+        manifest = self._read_processed_manifest()
+        if not manifest or self._is_stale_manifest(manifest):
+            return
+        for filename, digest in manifest.get("sha256", {}).items():
+            file_path = os.path.join(self.raw_dataset_dir, filename)
+            if os.path.exists(file_path):
+                self._record_file_digest(file_path, digest)
+
+    def _is_stale_manifest(self, manifest: dict) -> bool:
+        current = self._processed_manifest()
+        return any(manifest.get(key) != value for key, value in current.items())
+
+    def _is_processed_dataset_stale(self) -> bool:
+        """Whether the raw files or the ludwig version changed since the processed dataset was saved.
+
+        Processed datasets without a manifest, or whose raw files have been removed, are always considered current.
+        """
+        manifest = self._read_processed_manifest()
+        if manifest is None or not self._is_stale_manifest(manifest):
+            return False
+        logger.info(f"Raw files of dataset {self.name} changed since it was processed, it will be processed again.")
+        return True
 
     def load_transformed_dataset(self) -> pd.DataFrame:
         """Load processed dataset into a dataframe."""
-        return pd.read_parquet(self.processed_dataset_path)
+        # The processed dataset is always a local file, so map it into memory instead of reading it through buffers.
+        return pd.read_parquet(self.processed_dataset_path, engine="pyarrow", memory_map=True)
 
     def get_mtime(self) -> float:
         """Last modified time of the processed dataset after downloading successfully."""
@@ -26,7 +26,6 @@ class InsuranceLiteLoader(DatasetLoader):
     def transform_dataframe(self, dataframe: pd.DataFrame) -> pd.DataFrame:
         df = super().transform_dataframe(dataframe)
         # Make image paths relative to dataset root directory
-        df["image_path"] = df["image_path"].apply(
-            lambda x: os.path.join("Fast_Furious_Insured", "trainImages", os.path.basename(x))
-        )
+        image_dir = os.path.join("Fast_Furious_Insured", "trainImages", "")
+        df["image_path"] = image_dir + df["image_path"].str.rsplit("/", n=1).str[-1]
         return df
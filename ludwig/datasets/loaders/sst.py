@@ -15,6 +15,7 @@
 import os
 from typing import List, Optional, Set
 
+import numpy as np
 import pandas as pd
 
 from ludwig.datasets.dataset_config import DatasetConfig
@@ -48,10 +49,26 @@ class SSTLoader(DatasetLoader):
         self.convert_parentheses = convert_parentheses
         self.remove_duplicates = remove_duplicates
 
-    @staticmethod
-    def get_sentiment_label(id2sent, phrase_id):
+    def get_sentiment_label(self, id2sent, phrase_id):
+        return self.get_sentiment_labels(np.array([id2sent[phrase_id]], dtype=float))[0].item()
+
+    def get_sentiment_labels(self, sentiments: np.ndarray) -> np.ndarray:
+        """Maps an array of sentiment values in [0, 1] to an array of labels."""
         raise NotImplementedError
 
+    def get_labeled_phrases(self, phrases: List[str], phrase2id, id2sent) -> List[list]:
+        """Labels all phrases at once, returning [phrase, label] pairs without neutral phrases if discard_neutral."""
+        sentiments = np.array([id2sent[phrase2id[phrase]] for phrase in phrases], dtype=float)
+        labels = self.get_sentiment_labels(sentiments).tolist()
+        pairs = []
+        for phrase, label in zip(phrases, labels):
+            if not self.discard_neutral or label != -1:
+                if not self.convert_parentheses:
+                    phrase = convert_parentheses_back(phrase)
+                    phrase = phrase.replace("\xa0", " ")
+                pairs.append([phrase, label])
+        return pairs
+
     def transform_files(self, file_paths: List[str]) -> List[str]:
         # maybe this should be
 
@@ -111,41 +128,35 @@ class SSTLoader(DatasetLoader):
         for split_name, split_id in splits.items():
             sentence_idcs = get_sentence_idcs_in_split(datasplit_df, split_id)
 
-            pairs = []
             if split_name == "train" and self.include_subtrees:
-                phrases = []
+                sentence_phrases = []
+                sentence_subtrees_list = []
                 for sentence_idx in sentence_idcs:
                     # trees_pointers and trees_phrases are 0 indexed
                     # while sentence_idx starts from 1
                     # so we need to decrease sentence_idx value
                     sentence_idx -= 1
-                    subtrees = sentence_subtrees(sentence_idx, trees_pointers, trees_phrases)
+                    sentence_subtrees_list.append(sentence_subtrees(sentence_idx, trees_pointers, trees_phrases))
 
                     sentence_idx += 1
                     sentence_phrase = list(sentences_df[sentences_df["sentence_index"] == sentence_idx]["sentence"])[0]
-
-                    sentence_phrase = convert_parentheses(sentence_phrase)
-                    label = self.get_sentiment_label(id2sent, phrase2id[sentence_phrase])
-                    # filter @ sentence level
-                    # For SST-2, check subtrees only if sentence is not neutral
-                    if not self.discard_neutral or label != -1:
-                        for phrase in subtrees:
-                            label = self.get_sentiment_label(id2sent, phrase2id[phrase])
-                            if not self.discard_neutral or label != -1:
-                                if not self.convert_parentheses:
-                                    phrase = convert_parentheses_back(phrase)
-                                    phrase = phrase.replace("\xa0", " ")
-                                pairs.append([phrase, label])
+                    sentence_phrases.append(convert_parentheses(sentence_phrase))
+
+                # filter @ sentence level
+                # For SST-2, check subtrees only if sentence is not neutral
+                sentiments = np.array([id2sent[phrase2id[phrase]] for phrase in sentence_phrases], dtype=float)
+                sentence_labels = self.get_sentiment_labels(sentiments)
+                phrases = [
+                    phrase
+                    for subtrees, label in zip(sentence_subtrees_list, sentence_labels)
+                    if not self.discard_neutral or label != -1
+                    for phrase in subtrees
+                ]
             else:
-                phrases = get_sentences_with_idcs(sentences_df, sentence_idcs)
-                for phrase in phrases:
-                    phrase = convert_parentheses(phrase)
-                    label = self.get_sentiment_label(id2sent, phrase2id[phrase])
-                    if not self.discard_neutral or label != -1:
-                        if not self.convert_parentheses:
-                            phrase = convert_parentheses_back(phrase)
-                            phrase = phrase.replace("\xa0", " ")
-                        pairs.append([phrase, label])
+                phrases = [
+                    convert_parentheses(phrase) for phrase in get_sentences_with_idcs(sentences_df, sentence_idcs)
+                ]
+            pairs = self.get_labeled_phrases(phrases, phrase2id, id2sent)
 
             final_csv = pd.DataFrame(pairs)
             final_csv.columns = ["sentence", "label"]
@@ -192,13 +203,9 @@ class SST2Loader(SSTLoader):
             remove_duplicates=remove_duplicates,
         )
 
-    def get_sentiment_label(self, id2sent, phrase_id):
-        sentiment = id2sent[phrase_id]
-        if sentiment <= 0.4:  # negative
-            return 0
-        elif sentiment > 0.6:  # positive
-            return 1
-        return -1  # neutral
+    def get_sentiment_labels(self, sentiments: np.ndarray) -> np.ndarray:
+        # negative: [0, 0.4], neutral: (0.4, 0.6], positive: (0.6, 1.0]
+        return np.array([0, -1, 1])[np.searchsorted([0.4, 0.6], sentiments, side="left")]
 
 
 class SST3Loader(SSTLoader):
@@ -233,15 +240,10 @@ class SST3Loader(SSTLoader):
             remove_duplicates=remove_duplicates,
         )
 
-    def get_sentiment_label(self, id2sent, phrase_id):
-        sentiment = id2sent[phrase_id]
-        if sentiment <= 0.4:
-            return "negative"
-        elif sentiment <= 0.6:
-            return "neutral"
-        elif sentiment <= 1.0:
-            return "positive"
-        return "neutral"
+    def get_sentiment_labels(self, sentiments: np.ndarray) -> np.ndarray:
+        # Sentiments above 1.0 are out of range and labeled neutral.
+        labels = np.array(["negative", "neutral", "positive", "neutral"])
+        return labels[np.searchsorted([0.4, 0.6, 1.0], sentiments, side="left")]
 
 
 class SST5Loader(SSTLoader):
@@ -276,19 +278,10 @@ class SST5Loader(SSTLoader):
             remove_duplicates=remove_duplicates,
         )
 
-    def get_sentiment_label(self, id2sent, phrase_id):
-        sentiment = id2sent[phrase_id]
-        if sentiment <= 0.2:
-            return "very_negative"
-        elif sentiment <= 0.4:
-            return "negative"
-        elif sentiment <= 0.6:
-            return "neutral"
-        elif sentiment <= 0.8:
-            return "positive"
-        elif sentiment <= 1.0:
-            return "very_positive"
-        return "neutral"
+    def get_sentiment_labels(self, sentiments: np.ndarray) -> np.ndarray:
+        # Sentiments above 1.0 are out of range and labeled neutral.
+        labels = np.array(["very_negative", "negative", "neutral", "positive", "very_positive", "neutral"])
+        return labels[np.searchsorted([0.2, 0.4, 0.6, 0.8, 1.0], sentiments, side="left")]
 
 
 def format_text(text: str):
@@ -1,7 +1,10 @@
 import contextlib
 import logging
+import os
+from collections import defaultdict
 from typing import Any, Callable, Dict, List, Optional, Tuple, Type, TYPE_CHECKING
 
+import cloudpickle
 import horovod.torch as hvd
 import ray
 import torch
@@ -11,6 +14,7 @@ from ray.train.backend import BackendConfig
 from ray.train.data_parallel_trainer import DataParallelTrainer
 from ray.train.horovod import HorovodTrainer
 from torch import nn
+from torch._utils import _flatten_dense_tensors, _unflatten_dense_tensors
 from torch.optim import Optimizer
 
 from ludwig.constants import AUTO
@@ -25,8 +29,34 @@ _ray220 = version.parse(ray.__version__) >= version.parse("2.2.0")
 
 
 class HorovodStrategy(DistributedStrategy):
-    def __init__(self):
+    def __init__(
+        self,
+        hierarchical_allreduce: Optional[bool] = None,
+        fusion_threshold_mb: Optional[int] = None,
+        cycle_time_ms: Optional[float] = None,
+    ):
+        """Initializes Horovod.
+
+        The tuning options are passed to Horovod through its environment variables, which it reads on init. Options left
+        unset keep Horovod's defaults, or any value already set in the environment. When using the Ray backend, they can
+        be set with a strategy dict, e.g. `strategy: {type: horovod, hierarchical_allreduce: true}`.
+
+        :param hierarchical_allreduce: reduce within each node before reducing across nodes, which cuts inter-node
+            traffic on multi-node clusters with fast intra-node links.
+        :param fusion_threshold_mb: size of the buffer small tensors are fused into before being reduced together.
+        :param cycle_time_ms: time to wait for tensors to fuse before starting a reduction.
+        """
+        if hierarchical_allreduce is not None:
+            os.environ["HOROVOD_HIERARCHICAL_ALLREDUCE"] = "1" if hierarchical_allreduce else "0"
+            os.environ["HOROVOD_HIERARCHICAL_ALLGATHER"] = "1" if hierarchical_allreduce else "0"
+        if fusion_threshold_mb is not None:
+            os.environ["HOROVOD_FUSION_THRESHOLD"] = str(int(fusion_threshold_mb * 1024 * 1024))
+        if cycle_time_ms is not None:
+            os.environ["HOROVOD_CYCLE_TIME"] = str(cycle_time_ms)
         hvd.init()
+        # Reused by every barrier rather than allocating a new tensor per call. allreduce is out-of-place, so this is
+        # never modified.
+        self._barrier_tensor = torch.zeros(1, dtype=torch.int)
         logging.info("Using Horovod strategy")
 
     def prepare(
@@ -59,7 +89,7 @@ class HorovodStrategy(DistributedStrategy):
         return hvd.local_rank()
 
     def barrier(self):
-        return hvd.allreduce(torch.as_tensor([0], dtype=torch.int))
+        return hvd.allreduce(self._barrier_tensor, name="barrier")
 
     def allreduce(self, t: torch.Tensor) -> torch.Tensor:
         return hvd.allreduce(t)
@@ -68,19 +98,50 @@ class HorovodStrategy(DistributedStrategy):
         return hvd.broadcast(t, root_rank=0)
 
     def sync_model(self, model: nn.Module):
-        hvd.broadcast_parameters(model.state_dict(), root_rank=0)
+        # Broadcast the model as one flat buffer per dtype and device rather than one broadcast per tensor, as models
+        # with many small tensors are otherwise dominated by the latency of each broadcast.
+        groups = defaultdict(list)
+        for tensor in model.state_dict().values():
+            groups[(tensor.dtype, tensor.device)].append(tensor)
+        for (dtype, device), tensors in groups.items():
+            flat = _flatten_dense_tensors(tensors)
+            hvd.broadcast_(flat, root_rank=0, name=f"sync_model.{dtype}.{device.type}")
+            # State dict tensors share storage with the model, so copying into them updates the model in place.
+            for tensor, synced in zip(tensors, _unflatten_dense_tensors(flat, tensors)):
+                tensor.copy_(synced)
 
     def sync_optimizer(self, optimizer: Optimizer):
         hvd.broadcast_optimizer_state(optimizer, root_rank=0)
 
     def broadcast_object(self, v: Any, name: Optional[str] = None) -> Any:
-        return hvd.broadcast_object(v, name=name)
+        # Same protocol as hvd.broadcast_object (broadcast the payload size, then the pickled bytes), but the payload
+        # tensor wraps the pickled buffer directly instead of being built element by element from a Python bytearray.
+        name = name or type(v).__name__
+        is_root = hvd.rank() == 0
+        if is_root:
+            payload = torch.frombuffer(bytearray(cloudpickle.dumps(v)), dtype=torch.uint8)
+            size = torch.tensor([payload.numel()], dtype=torch.int64)
+        else:
+            size = torch.zeros(1, dtype=torch.int64)
+        hvd.broadcast_(size, root_rank=0, name=f"{name}.sz")
+
+        if not is_root:
+            payload = torch.empty(size.item(), dtype=torch.uint8)
+        hvd.broadcast_(payload, root_rank=0, name=f"{name}.t")
+
+        if is_root:
+            return v
+        return cloudpickle.loads(memoryview(payload.numpy()))
 
     def wait_optimizer_synced(self, optimizer: _DistributedOptimizer):
         optimizer.synchronize()
 
     @contextlib.contextmanager
     def prepare_model_update(self, model: nn.Module, should_step: bool):
+        # Unlike DDP, nothing needs to be disabled while accumulating gradients: the optimizer is created with
+        # backward_passes_per_step set to the number of accumulation steps, so its gradient hooks only launch the
+        # allreduce on the last backward pass before a step. If a step happens earlier (e.g. at the end of an epoch),
+        # optimizer.synchronize() reduces any gradients that are still pending.
         yield
 
     @contextlib.contextmanager
@@ -11,7 +11,6 @@ import pandas as pd
 import torch
 from captum.attr import LayerIntegratedGradients, TokenReferenceBase
 from captum.attr._utils.input_layer_wrapper import InputIdentity
-from torch.autograd import Variable
 from tqdm import tqdm
 
 from ludwig.api import LudwigModel
@@ -33,7 +32,7 @@ from ludwig.constants import (
 )
 from ludwig.data.preprocessing import preprocess_for_prediction
 from ludwig.explain.explainer import Explainer
-from ludwig.explain.explanation import ExplanationsResult
+from ludwig.explain.explanation import ExplanationsResult, LabelExplanation
 from ludwig.explain.util import get_pred_col, replace_layer_with_copy
 from ludwig.features.feature_utils import LudwigFeatureDict
 from ludwig.models.ecd import ECD
@@ -45,6 +44,9 @@ logger = logging.getLogger(__name__)
 # As such, we need to take care to encode them before handing them to the explainer.
 EMBEDDED_TYPES = {SEQUENCE, TEXT, CATEGORY, SET, DATE}
 
+# Integer dtypes of the inputs that are used as indices into an embedding table.
+INT_DTYPES = frozenset({torch.int8, torch.int16, torch.int32, torch.int64})
+
 
 @dataclass
 class ExplanationRunConfig:
@@ -116,17 +118,21 @@ class WrapperModule(torch.nn.Module):
             }
         )
 
+        # The input features are fixed once the model is wrapped, so resolve the order of the args and which of them
+        # are routed through an identity layer once, rather than on every forward pass.
+        self.input_feature_names = list(self.model.input_features.keys())
+        self.input_identity_layers = [
+            None if self.model.input_features.get(name).type() in EMBEDDED_TYPES else self.input_maps.get(name)
+            for name in self.input_feature_names
+        ]
+
     def forward(self, *args):
         # Add back the dictionary structure so it conforms to ECD format.
-        input_features: LudwigFeatureDict = self.model.input_features
-        inputs = {
+        inputs = {}
+        for feat_name, identity_layer, feat_input in zip(self.input_feature_names, self.input_identity_layers, args):
             # Send the input through the identity layer so that we can use the output of the layer for attribution.
             # Except for text/category features where we use the embedding layer for attribution.
-            feat_name: feat_input
-            if input_features.get(feat_name).type() in EMBEDDED_TYPES
-            else self.input_maps.get(feat_name)(feat_input)
-            for feat_name, feat_input in zip(input_features.keys(), args)
-        }
+            inputs[feat_name] = feat_input if identity_layer is None else identity_layer(feat_input)
 
         outputs = self.model(inputs)
 
@@ -152,6 +158,34 @@ class WrapperModule(torch.nn.Module):
 
 @PublicAPI(stability="experimental")
 class IntegratedGradientsExplainer(Explainer):
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        # Built lazily on the first call to `explain`, once the encoders have been unskipped and moved to the device.
+        self._explainer: Optional[LayerIntegratedGradients] = None
+        # Only depends on the model and the sample data, so it is computed once and reused by later calls to `explain`.
+        self._baseline: Optional[List[torch.Tensor]] = None
+
+    def get_explainer(self) -> LayerIntegratedGradients:
+        """Returns the LayerIntegratedGradients explainer for the target feature, building it on first use."""
+        if self._explainer is None:
+            self._explainer = get_explainer(self.model, self.target_feature_name)
+        return self._explainer
+
+    def add_negative_class_explanations(self, feat_names: List[str]):
+        """For binary targets, prepends the explanations for the negative class (false) to the global and row
+        explanations.
+
+        The attributions for the negative class are the negated attributions for the positive class, so they are
+        computed for all rows at once rather than row by row.
+        """
+        explanations = [self.global_explanation] + self.row_explanations
+        label_explanations = [explanation.label_explanations[0] for explanation in explanations]
+        negated_attributions = np.negative(np.stack([le.to_array() for le in label_explanations]))
+
+        for explanation, le_true, attributions in zip(explanations, label_explanations, negated_attributions):
+            # Prepend the negative class to the list of label explanations.
+            explanation.add(feat_names, attributions, negate_token_attributions(le_true), prepend=True)
+
     def explain(self) -> ExplanationsResult:
         """Explain the model's predictions using Integrated Gradients.
 
@@ -181,8 +215,13 @@ class IntegratedGradientsExplainer(Explainer):
 
         # Convert input data into embedding tensors from the output of the model encoders.
         inputs_encoded = get_input_tensors_with_retry(self.model, self.inputs_df, run_config)
-        sample_encoded = get_input_tensors_with_retry(self.model, self.sample_df, run_config)
-        baseline = get_baseline(self.model, sample_encoded)
+        if self._baseline is None:
+            sample_encoded = get_input_tensors_with_retry(self.model, self.sample_df, run_config)
+            self._baseline = get_baseline(self.model, sample_encoded)
+        baseline = self._baseline
+
+        # The explainer does not depend on the target label, so it is reused for every label.
+        explainer = self.get_explainer()
 
         # Compute attribution for each possible output feature label separately.
         expected_values = []
@@ -195,6 +234,7 @@ class IntegratedGradientsExplainer(Explainer):
                 baseline,
                 len(self.inputs_df),
                 run_config,
+                explainer=explainer,
             )
 
             # Aggregate token attributions
@@ -236,28 +276,7 @@ class IntegratedGradientsExplainer(Explainer):
 
         # For binary targets, add an extra attribution for the negative class (false).
         if self.is_binary_target:
-            le_true = self.global_explanation.label_explanations[0]
-            negated_attributions = le_true.to_array() * -1
-            negated_token_attributions = {
-                fa.feature_name: [(t, -a) for t, a in fa.token_attributions]
-                for fa in le_true.feature_attributions
-                if fa.token_attributions is not None
-            }
-            # Prepend the negative class to the list of label explanations.
-            self.global_explanation.add(
-                input_features.keys(), negated_attributions, negated_token_attributions, prepend=True
-            )
-
-            for explanation in self.row_explanations:
-                le_true = explanation.label_explanations[0]
-                negated_attributions = le_true.to_array() * -1
-                negated_token_attributions = {
-                    fa.feature_name: [(t, -a) for t, a in fa.token_attributions]
-                    for fa in le_true.feature_attributions
-                    if fa.token_attributions is not None
-                }
-                # Prepend the negative class to the list of label explanations.
-                explanation.add(input_features.keys(), negated_attributions, negated_token_attributions, prepend=True)
+            self.add_negative_class_explanations(input_features.keys())
 
             # TODO(travis): for force plots, need something similar to SHAP E[X]
             expected_values.append(0.0)
@@ -265,10 +284,24 @@ class IntegratedGradientsExplainer(Explainer):
         return ExplanationsResult(self.global_explanation, self.row_explanations, expected_values)
 
 
+def negate_token_attributions(label_explanation: LabelExplanation) -> Dict[str, List[Tuple[str, float]]]:
+    """Returns the negated token attributions for each input feature of the label explanation that has them."""
+    negated_token_attributions = {}
+    for fa in label_explanation.feature_attributions:
+        if fa.token_attributions is None:
+            continue
+        if len(fa.token_attributions) == 0:
+            negated_token_attributions[fa.feature_name] = []
+            continue
+        tokens, attributions = zip(*fa.token_attributions)
+        negated_token_attributions[fa.feature_name] = list(zip(tokens, np.negative(attributions).tolist()))
+    return negated_token_attributions
+
+
 def get_input_tensors(
     model: LudwigModel, input_set: pd.DataFrame, run_config: ExplanationRunConfig
 ) -> List[torch.Tensor]:
-    """Convert the input data into a list of variables, one for each input feature.
+    """Convert the input data into a list of tensors, one for each input feature.
 
     # Inputs
 
@@ -277,7 +310,7 @@ def get_input_tensors(
 
     # Return
 
-    :return: A list of variables, one for each input feature. Shape of each variable is [batch size, embedding size].
+    :return: A list of tensors, one for each input feature. Shape of each tensor is [batch size, embedding size].
     """
     # Ignore sample_ratio and sample_size from the model config, since we want to explain all the data.
     sample_ratio_bak = model.config_obj.preprocessing.sample_ratio
@@ -313,38 +346,34 @@ def get_input_tensors(
         dataset.to_df().shape[0] == input_set.shape[0]
     ), f"Expected {input_set.shape[0]} rows in preprocessed dataset, but got {dataset.to_df().shape[0]}"
 
-    # Convert dataset into a dict of tensors, and split each tensor into batches to control GPU memory usage
-    inputs = {
-        name: torch.from_numpy(dataset.dataset[feature.proc_column]).split(run_config.batch_size)
+    # Convert dataset into a list of tensors, one per input feature. Batching to control GPU memory usage happens when
+    # computing attributions, so there is no need to split the tensors here. Columns are only copied if they are not
+    # already contiguous, so the tensors share memory with the preprocessed dataset.
+    data_to_predict = [
+        torch.from_numpy(np.ascontiguousarray(dataset.dataset[feature.proc_column]))
         for name, feature in model.model.input_features.items()
-    }
-
-    # Dict of lists to list of dicts
-    input_batches = [dict(zip(inputs, t)) for t in zip(*inputs.values())]
-
-    # List of dicts to dict of lists
-    preproc_inputs = {k: torch.cat([d[k] for d in input_batches]) for k in input_batches[0]}
-
-    data_to_predict = [v for _, v in preproc_inputs.items()]
+    ]
     tensors = []
-    for t in data_to_predict:
-        # TODO(travis): Consider changing to `if not torch.is_floating_point(t.dtype)` to simplify, then handle bool
-        # case in this block.
-        if t.dtype == torch.int8 or t.dtype == torch.int16 or t.dtype == torch.int32 or t.dtype == torch.int64:
-            # Don't wrap input into a variable if it's an integer type, since it will be used as an index into the
+    for t, feature in zip(data_to_predict, model.model.input_features.values()):
+        if t.dtype == torch.bool or (t.dtype in INT_DTYPES and feature.type() not in EMBEDDED_TYPES):
+            # Boolean inputs and integer inputs that are not embedding indices (e.g. bag counts) are explained as
+            # floats.
+            t = t.to(torch.float32)
+
+        # TODO(travis): Consider changing to `if not torch.is_floating_point(t.dtype)` to simplify.
+        if t.dtype in INT_DTYPES:
+            # Don't track the gradient of the input if it's an integer type, since it will be used as an index into the
             # embedding table. We explain the output of the embedding table, not the input to the embedding table using
             # LayerIntegratedGradients.
             tensors.append(t)
         else:
-            # Wrap input into a variable so torch will track the gradient and LayerIntegratedGradients can explain it.
-            if t.dtype == torch.bool:
-                t = t.to(torch.float32)
-            tensors.append(Variable(t, requires_grad=True))
+            # Track the gradient of the input so LayerIntegratedGradients can explain it.
+            tensors.append(t.requires_grad_(True))
 
     return tensors
 
 
-def get_baseline(model: LudwigModel, sample_encoded: List[Variable]) -> List[torch.Tensor]:
+def get_baseline(model: LudwigModel, sample_encoded: List[torch.Tensor]) -> List[torch.Tensor]:
     # TODO(travis): pre-compute this during training from the full training dataset.
     input_features: LudwigFeatureDict = model.model.input_features
 
@@ -356,11 +385,12 @@ def get_baseline(model: LudwigModel, sample_encoded: List[Variable]) -> List[tor
             token_reference = TokenReferenceBase(reference_token_idx=PAD_IND)
             baseline = token_reference.generate_reference(sequence_length=sample_input.shape[1], device=DEVICE)
         elif feature.type() == CATEGORY:
-            most_popular_token = max(metadata["str2freq"], key=metadata["str2freq"].get)
-            most_popular_tok_idx = metadata["str2idx"].get(most_popular_token)
-
-            # If an unknown is defined, use that as the baseline index, else use the most popular token
-            baseline_tok_idx = metadata["str2idx"].get(UNKNOWN_SYMBOL, most_popular_tok_idx)
+            # If an unknown is defined, use that as the baseline index, else use the most popular token. Only scan
+            # the vocabulary for the most popular token when it is actually needed.
+            baseline_tok_idx = metadata["str2idx"].get(UNKNOWN_SYMBOL)
+            if baseline_tok_idx is None:
+                most_popular_token = max(metadata["str2freq"], key=metadata["str2freq"].get)
+                baseline_tok_idx = metadata["str2idx"].get(most_popular_token)
             baseline = torch.tensor(baseline_tok_idx, device=DEVICE)
         elif feature.type() == IMAGE:
             baseline = torch.zeros_like(sample_input[0], device=DEVICE)
@@ -372,15 +402,50 @@ def get_baseline(model: LudwigModel, sample_encoded: List[Variable]) -> List[tor
     return baselines
 
 
+def get_explainer(model: LudwigModel, target_feature_name: str) -> LayerIntegratedGradients:
+    """Configures the explainer, which includes wrapping the model so its interface conforms to the format expected by
+    Captum.
+
+    The explainer only depends on the model and the target feature, so it can be reused to explain every label of the
+    target feature.
+    """
+    input_features: LudwigFeatureDict = model.model.input_features
+
+    model.model.zero_grad()
+    explanation_model = WrapperModule(model.model, target_feature_name)
+
+    layers = []
+    for feat, identity_layer in zip(input_features.values(), explanation_model.input_identity_layers):
+        if identity_layer is None:
+            # Get embedding layer from encoder, which is the first child of the encoder.
+            target_layer = feat.encoder_obj.get_embedding_layer()
+
+            # If the current layer matches any layer in the list, make a deep copy of the layer.
+            if len(layers) > 0 and any(target_layer == layer for layer in layers):
+                # Replace the layer with a deep copy of the layer to ensure that the attributions unique for each input
+                # feature that uses a shared layer.
+                # Recommended here: https://github.com/pytorch/captum/issues/794#issuecomment-1093021638
+                replace_layer_with_copy(feat, target_layer)
+                target_layer = feat.encoder_obj.get_embedding_layer()  # get the new copy
+        else:
+            # Get the wrapped input layer.
+            target_layer = identity_layer
+
+        layers.append(target_layer)
+
+    return LayerIntegratedGradients(explanation_model, layers)
+
+
 def get_total_attribution(
     model: LudwigModel,
     target_feature_name: str,
     target_idx: Optional[int],
-    feature_inputs: List[Variable],
+    feature_inputs: List[torch.Tensor],
     baseline: List[torch.Tensor],
     nsamples: int,
     run_config: ExplanationRunConfig,
-) -> Tuple[npt.NDArray[np.float64], Dict[str, List[List[Tuple[str, float]]]]]:
+    explainer: Optional[LayerIntegratedGradients] = None,
+) -> Tuple[npt.NDArray[np.float32], Dict[str, List[List[Tuple[str, float]]]], npt.NDArray[np.float64]]:
     """Compute the total attribution for each input feature for each row in the input data.
 
     Args:
@@ -390,12 +455,14 @@ def get_total_attribution(
         feature_inputs: The preprocessed input data as a list of tensors of length [num_features].
         baseline: The baseline input data as a list of tensors of length [num_features].
         nsamples: The total number of samples in the input data.
+        explainer: The explainer returned by `get_explainer` for this model and target feature. Pass it in when
+            explaining several labels so it is only built once. Built on the fly if not provided.
 
     Returns:
         The token-attribution pair for each token in the input feature for each row in the input data. The members of
         the output tuple are structured as follows:
 
-        `total_attribution_rows`: (npt.NDArray[np.float64]) of shape [num_rows, num_features]
+        `total_attribution_rows`: (npt.NDArray[np.float32]) of shape [num_rows, num_features]
         The total attribution for each input feature for each row in the input data.
 
         `feat_to_token_attributions`: (Dict[str, List[List[Tuple[str, float]]]]) with values of shape
@@ -405,41 +472,19 @@ def get_total_attribution(
         The attribution for each input feature aggregated across all input data.
     """
     input_features: LudwigFeatureDict = model.model.input_features
-
-    # Configure the explainer, which includes wrapping the model so its interface conforms to
-    # the format expected by Captum.
-    model.model.zero_grad()
-    explanation_model = WrapperModule(model.model, target_feature_name)
-
-    layers = []
-    for feat_name, feat in input_features.items():
-        if feat.type() in EMBEDDED_TYPES:
-            # Get embedding layer from encoder, which is the first child of the encoder.
-            target_layer = feat.encoder_obj.get_embedding_layer()
-
-            # If the current layer matches any layer in the list, make a deep copy of the layer.
-            if len(layers) > 0 and any(target_layer == layer for layer in layers):
-                # Replace the layer with a deep copy of the layer to ensure that the attributions unique for each input
-                # feature that uses a shared layer.
-                # Recommended here: https://github.com/pytorch/captum/issues/794#issuecomment-1093021638
-                replace_layer_with_copy(feat, target_layer)
-                target_layer = feat.encoder_obj.get_embedding_layer()  # get the new copy
-        else:
-            # Get the wrapped input layer.
-            target_layer = explanation_model.input_maps.get(feat_name)
-
-        layers.append(target_layer)
-
-    explainer = LayerIntegratedGradients(explanation_model, layers)
+    if explainer is None:
+        explainer = get_explainer(model, target_feature_name)
 
     feature_inputs_splits = [ipt.split(run_config.batch_size) for ipt in feature_inputs]
     baseline = [t.to(DEVICE) for t in baseline]
 
+    num_rows = len(feature_inputs[0])
     total_attribution_rows = None
     total_attribution_global = None
+    offset = 0
     feat_to_token_attributions = defaultdict(list)
-    for input_batch in zip(*feature_inputs_splits):
-        input_batch = [ipt.to(DEVICE) for ipt in input_batch]
+    for input_batch_cpu in zip(*feature_inputs_splits):
+        input_batch = [ipt.to(DEVICE) for ipt in input_batch_cpu]
         attribution = explainer.attribute(
             tuple(input_batch),
             baselines=tuple(baseline),
@@ -464,27 +509,29 @@ def get_total_attribution(
                 a_reduced = a_reduced.sum(dim=(1, 2, 3))
             attributions_reduced.append(a_reduced)
 
-        for inputs, attrs, (name, feat) in zip(input_batch, attributions_reduced, input_features.items()):
+        for inputs, attrs, (name, feat) in zip(input_batch_cpu, attributions_reduced, input_features.items()):
             if feat.type() == TEXT:
-                tok_attrs = get_token_attributions(model, name, inputs.detach().cpu(), attrs)
+                # Use the host copy of the token ids rather than copying them back from the device.
+                tok_attrs = get_token_attributions(model, name, inputs.detach(), attrs)
                 feat_to_token_attributions[name].append(tok_attrs)
 
-        # Reduce attribution to [num_input_features, batch_size] by summing over the sequence dimension (if present).
-        attribution = [a.sum(dim=-1) if a.ndim == 2 else a for a in attributions_reduced]
-        attribution = np.stack(attribution)
+        # Reduce attribution to [batch_size, num_input_features] by summing over the sequence dimension (if present)
+        # and stacking the per-feature attributions along the feature axis.
+        attribution = [(a.sum(dim=-1) if a.ndim == 2 else a).numpy() for a in attributions_reduced]
+        attribution = np.stack(attribution, axis=1)
 
-        # Transpose to [batch_size, num_input_features]
-        attribution = attribution.T
-
-        if total_attribution_rows is not None:
-            total_attribution_rows = np.concatenate([total_attribution_rows, attribution], axis=0)
-        else:
-            total_attribution_rows = attribution
+        # Write each batch into a preallocated array rather than concatenating, which would copy all previous rows.
+        # The attributions are derived from float32 activations, so store them as float32. Only the global sum is
+        # accumulated in float64, since it adds up every row.
+        if total_attribution_rows is None:
+            total_attribution_rows = np.empty((num_rows, attribution.shape[1]), dtype=np.float32)
+        total_attribution_rows[offset : offset + len(attribution)] = attribution
+        offset += len(attribution)
 
         if total_attribution_global is not None:
-            total_attribution_global += attribution.sum(axis=0)
+            total_attribution_global += attribution.sum(axis=0, dtype=np.float64)
         else:
-            total_attribution_global = attribution.sum(axis=0)
+            total_attribution_global = attribution.sum(axis=0, dtype=np.float64)
 
     total_attribution_global /= nsamples
 
@@ -512,12 +559,7 @@ def get_token_attributions(
     Returns:
         An array of token-attribution pairs of shape [batch_size, sequence_length, 2].
     """
-    assert (
-        input_ids.dtype == torch.int8
-        or input_ids.dtype == torch.int16
-        or input_ids.dtype == torch.int32
-        or input_ids.dtype == torch.int64
-    )
+    assert input_ids.dtype in INT_DTYPES
 
     # Normalize token-level attributions to visualize the relative importance of each token.
     norm = torch.linalg.norm(token_attributions, dim=1)
@@ -528,12 +570,12 @@ def get_token_attributions(
     # map input ids to input tokens via the vocabulary
     feature = model.training_set_metadata[feature_name]
     vocab = feature.get("idx2str", feature.get("word_idx2str"))
-    idx2str = np.vectorize(lambda idx: vocab[idx])
-    input_tokens = idx2str(input_ids)
+    # Gather all tokens at once by indexing into the vocabulary, rather than looking up each id in Python.
+    input_tokens = np.asarray(vocab, dtype=object)[input_ids.cpu().numpy()]
 
     # add attribution to the input tokens
     tok_attrs = [
-        list(zip(t, a)) for t, a in zip(input_tokens, token_attributions.tolist())
+        list(zip(t, a)) for t, a in zip(input_tokens.tolist(), token_attributions.tolist())
     ]  # [batch_size, sequence_length, 2]
 
     return tok_attrs
@@ -4,7 +4,7 @@ from typing import Any, Dict, List, Optional, Tuple
 import numpy as np
 import pandas as pd
 import ray
-from torch.autograd import Variable
+import torch
 from tqdm import tqdm
 
 from ludwig.api import LudwigModel
@@ -12,6 +12,7 @@ from ludwig.api_annotations import PublicAPI
 from ludwig.explain.captum import (
     ExplanationRunConfig,
     get_baseline,
+    get_explainer,
     get_input_tensors,
     get_total_attribution,
     IntegratedGradientsExplainer,
@@ -131,28 +132,7 @@ class RayIntegratedGradientsExplainer(IntegratedGradientsExplainer):
 
         # For binary targets, add an extra attribution for the negative class (false).
         if self.is_binary_target:
-            le_true = self.global_explanation.label_explanations[0]
-            negated_attributions = le_true.to_array() * -1
-            negated_token_attributions = {
-                fa.feature_name: [(t, -a) for t, a in fa.token_attributions]
-                for fa in le_true.feature_attributions
-                if fa.token_attributions is not None
-            }
-            # Prepend the negative class to the list of label explanations.
-            self.global_explanation.add(
-                input_features.keys(), negated_attributions, negated_token_attributions, prepend=True
-            )
-
-            for explanation in self.row_explanations:
-                le_true = explanation.label_explanations[0]
-                negated_attributions = le_true.to_array() * -1
-                negated_token_attributions = {
-                    fa.feature_name: [(t, -a) for t, a in fa.token_attributions]
-                    for fa in le_true.feature_attributions
-                    if fa.token_attributions is not None
-                }
-                # Prepend the negative class to the list of label explanations.
-                explanation.add(input_features.keys(), negated_attributions, negated_token_attributions, prepend=True)
+            self.add_negative_class_explanations(input_features.keys())
 
             # TODO(travis): for force plots, need something similar to SHAP E[X]
             expected_values.append(0.0)
@@ -163,7 +143,7 @@ class RayIntegratedGradientsExplainer(IntegratedGradientsExplainer):
 @ray.remote(max_calls=1)
 def get_input_tensors_task(
     model: LudwigModel, df: pd.DataFrame, run_config: ExplanationRunConfig
-) -> Tuple[List[Variable], ExplanationRunConfig]:
+) -> Tuple[List[torch.Tensor], ExplanationRunConfig]:
     model.model.unskip()
     model.model.to(get_torch_device())
     try:
@@ -178,8 +158,8 @@ def get_total_attribution_task(
     model: LudwigModel,
     target_feature_name: str,
     target_indices: List[Optional[int]],
-    inputs_encoded: List[Variable],
-    baseline: List[Variable],
+    inputs_encoded: List[torch.Tensor],
+    baseline: List[torch.Tensor],
     nsamples: int,
     run_config: ExplanationRunConfig,
 ) -> List[np.array]:
@@ -187,6 +167,8 @@ def get_total_attribution_task(
     model.model.to(get_torch_device())
     try:
         get_total_attribution_with_retry = retry_with_halved_batch_size(run_config)(get_total_attribution)
+        # Build the explainer once for all of the labels explained by this task.
+        explainer = get_explainer(model, target_feature_name)
         return [
             get_total_attribution_with_retry(
                 model=model,
@@ -196,6 +178,7 @@ def get_total_attribution_task(
                 baseline=baseline,
                 nsamples=nsamples,
                 run_config=run_config,
+                explainer=explainer,
             )
             for target_idx in tqdm(target_indices, desc="Explain")
         ]
@@ -17,15 +17,12 @@ import argparse
 import logging
 import os
 import sys
-from typing import Optional
+from typing import Callable, Optional
 
 from ludwig.api import LudwigModel
 from ludwig.contrib import add_contrib_callback_args
 from ludwig.globals import LUDWIG_VERSION
-from ludwig.utils.carton_utils import export_carton as utils_export_carton
-from ludwig.utils.neuropod_utils import export_neuropod as utils_export_neuropod
 from ludwig.utils.print_utils import get_logging_level_registry, print_ludwig
-from ludwig.utils.triton_utils import export_triton as utils_export_triton
 
 logger = logging.getLogger(__name__)
 
@@ -81,6 +78,8 @@ def export_triton(model_path, output_path="model_repository", model_name="ludwig
     logger.info(f"Model version: {model_version}")
     logger.info("\n")
 
+    from ludwig.utils.triton_utils import export_triton as utils_export_triton
+
     model = LudwigModel.load(model_path)
     os.makedirs(output_path, exist_ok=True)
 
@@ -108,6 +107,8 @@ def export_carton(model_path, output_path="carton", model_name="carton", **kwarg
     logger.info(f"Output path: {output_path}")
     logger.info("\n")
 
+    from ludwig.utils.carton_utils import export_carton as utils_export_carton
+
     model = LudwigModel.load(model_path)
     os.makedirs(output_path, exist_ok=True)
     utils_export_carton(model, output_path, model_name)
@@ -134,6 +135,8 @@ def export_neuropod(model_path, output_path="neuropod", model_name="neuropod", *
     logger.info(f"Output path: {output_path}")
     logger.info("\n")
 
+    from ludwig.utils.neuropod_utils import export_neuropod as utils_export_neuropod
+
     model = LudwigModel.load(model_path)
     os.makedirs(output_path, exist_ok=True)
     utils_export_neuropod(model, output_path, model_name)
@@ -167,17 +170,53 @@ def export_mlflow(model_path, output_path="mlflow", registered_model_name=None,
     logger.info(f"Saved to: {output_path}")
 
 
-def cli_export_torchscript(sys_argv):
-    parser = argparse.ArgumentParser(
-        description="This script loads a pretrained model " "and saves it as torchscript.",
-        prog="ludwig export_torchscript",
-        usage="%(prog)s [options]",
-    )
+def _make_export_parser(description: str, prog: str) -> argparse.ArgumentParser:
+    """Returns the argument parser shared by the export CLIs, with the model path argument already added."""
+    parser = argparse.ArgumentParser(description=description, prog=prog, usage="%(prog)s [options]")
 
     # ----------------
     # Model parameters
     # ----------------
     parser.add_argument("-m", "--model_path", help="model to load", required=True)
+    return parser
+
+
+def _run_export_cli(
+    parser: argparse.ArgumentParser, sys_argv, command: str, title: str, export_fn: Callable[..., None]
+) -> None:
+    """Adds the runtime arguments shared by the export CLIs to the parser, parses `sys_argv` and runs the export."""
+    # ------------------
+    # Runtime parameters
+    # ------------------
+    parser.add_argument(
+        "-l",
+        "--logging_level",
+        default="info",
+        help="the level of logging to use",
+        choices=["critical", "error", "warning", "info", "debug", "notset"],
+    )
+
+    add_contrib_callback_args(parser)
+    args = parser.parse_args(sys_argv)
+
+    args.callbacks = args.callbacks or []
+    for callback in args.callbacks:
+        callback.on_cmdline(command, *sys_argv)
+
+    args.logging_level = get_logging_level_registry()[args.logging_level]
+    logging.getLogger("ludwig").setLevel(args.logging_level)
+    global logger
+    logger = logging.getLogger("ludwig.export")
+
+    print_ludwig(title, LUDWIG_VERSION)
+
+    export_fn(**vars(args))
+
+
+def cli_export_torchscript(sys_argv):
+    parser = _make_export_parser(
+        "This script loads a pretrained model and saves it as torchscript.", "ludwig export_torchscript"
+    )
     parser.add_argument(
         "-mo",
         "--model_only",
@@ -206,45 +245,13 @@ def cli_export_torchscript(sys_argv):
         default=None,
     )
 
-    # ------------------
-    # Runtime parameters
-    # ------------------
-    parser.add_argument(
-        "-l",
-        "--logging_level",
-        default="info",
-        help="the level of logging to use",
-        choices=["critical", "error", "warning", "info", "debug", "notset"],
-    )
-
-    add_contrib_callback_args(parser)
-    args = parser.parse_args(sys_argv)
-
-    args.callbacks = args.callbacks or []
-    for callback in args.callbacks:
-        callback.on_cmdline("export_torchscript", *sys_argv)
-
-    args.logging_level = get_logging_level_registry()[args.logging_level]
-    logging.getLogger("ludwig").setLevel(args.logging_level)
-    global logger
-    logger = logging.getLogger("ludwig.export")
-
-    print_ludwig("Export Torchscript", LUDWIG_VERSION)
-
-    export_torchscript(**vars(args))
+    _run_export_cli(parser, sys_argv, "export_torchscript", "Export Torchscript", export_torchscript)
 
 
 def cli_export_triton(sys_argv):
-    parser = argparse.ArgumentParser(
-        description="This script loads a pretrained model " "and saves it as torchscript for Triton.",
-        prog="ludwig export_neuropod",
-        usage="%(prog)s [options]",
+    parser = _make_export_parser(
+        "This script loads a pretrained model and saves it as torchscript for Triton.", "ludwig export_triton"
     )
-
-    # ----------------
-    # Model parameters
-    # ----------------
-    parser.add_argument("-m", "--model_path", help="model to load", required=True)
     parser.add_argument("-mn", "--model_name", help="model name", default="ludwig_model")
     parser.add_argument("-mv", "--model_version", type=int, help="model version", default=1)
 
@@ -253,45 +260,13 @@ def cli_export_triton(sys_argv):
     # -----------------
     parser.add_argument("-op", "--output_path", type=str, help="path where to save the export model", required=True)
 
-    # ------------------
-    # Runtime parameters
-    # ------------------
-    parser.add_argument(
-        "-l",
-        "--logging_level",
-        default="info",
-        help="the level of logging to use",
-        choices=["critical", "error", "warning", "info", "debug", "notset"],
-    )
-
-    add_contrib_callback_args(parser)
-    args = parser.parse_args(sys_argv)
-
-    args.callbacks = args.callbacks or []
-    for callback in args.callbacks:
-        callback.on_cmdline("export_triton", *sys_argv)
-
-    args.logging_level = get_logging_level_registry()[args.logging_level]
-    logging.getLogger("ludwig").setLevel(args.logging_level)
-    global logger
-    logger = logging.getLogger("ludwig.export")
-
-    print_ludwig("Export Triton", LUDWIG_VERSION)
-
-    export_triton(**vars(args))
+    _run_export_cli(parser, sys_argv, "export_triton", "Export Triton", export_triton)
 
 
 def cli_export_carton(sys_argv):
-    parser = argparse.ArgumentParser(
-        description="This script loads a pretrained model " "and saves it as a Carton.",
-        prog="ludwig export_carton",
-        usage="%(prog)s [options]",
+    parser = _make_export_parser(
+        "This script loads a pretrained model and saves it as a Carton.", "ludwig export_carton"
     )
-
-    # ----------------
-    # Model parameters
-    # ----------------
-    parser.add_argument("-m", "--model_path", help="model to load", required=True)
     parser.add_argument("-mn", "--model_name", help="model name", default="carton")
 
     # -----------------
@@ -299,45 +274,13 @@ def cli_export_carton(sys_argv):
     # -----------------
     parser.add_argument("-op", "--output_path", type=str, help="path where to save the export model", required=True)
 
-    # ------------------
-    # Runtime parameters
-    # ------------------
-    parser.add_argument(
-        "-l",
-        "--logging_level",
-        default="info",
-        help="the level of logging to use",
-        choices=["critical", "error", "warning", "info", "debug", "notset"],
-    )
-
-    add_contrib_callback_args(parser)
-    args = parser.parse_args(sys_argv)
-
-    args.callbacks = args.callbacks or []
-    for callback in args.callbacks:
-        callback.on_cmdline("export_carton", *sys_argv)
-
-    args.logging_level = get_logging_level_registry()[args.logging_level]
-    logging.getLogger("ludwig").setLevel(args.logging_level)
-    global logger
-    logger = logging.getLogger("ludwig.export")
-
-    print_ludwig("Export Carton", LUDWIG_VERSION)
-
-    export_carton(**vars(args))
+    _run_export_cli(parser, sys_argv, "export_carton", "Export Carton", export_carton)
 
 
 def cli_export_neuropod(sys_argv):
-    parser = argparse.ArgumentParser(
-        description="This script loads a pretrained model " "and saves it as a Neuropod.",
-        prog="ludwig export_neuropod",
-        usage="%(prog)s [options]",
+    parser = _make_export_parser(
+        "This script loads a pretrained model and saves it as a Neuropod.", "ludwig export_neuropod"
     )
-
-    # ----------------
-    # Model parameters
-    # ----------------
-    parser.add_argument("-m", "--model_path", help="model to load", required=True)
     parser.add_argument("-mn", "--model_name", help="model name", default="neuropod")
 
     # -----------------
@@ -345,45 +288,13 @@ def cli_export_neuropod(sys_argv):
     # -----------------
     parser.add_argument("-op", "--output_path", type=str, help="path where to save the export model", required=True)
 
-    # ------------------
-    # Runtime parameters
-    # ------------------
-    parser.add_argument(
-        "-l",
-        "--logging_level",
-        default="info",
-        help="the level of logging to use",
-        choices=["critical", "error", "warning", "info", "debug", "notset"],
-    )
-
-    add_contrib_callback_args(parser)
-    args = parser.parse_args(sys_argv)
-
-    args.callbacks = args.callbacks or []
-    for callback in args.callbacks:
-        callback.on_cmdline("export_neuropod", *sys_argv)
-
-    args.logging_level = get_logging_level_registry()[args.logging_level]
-    logging.getLogger("ludwig").setLevel(args.logging_level)
-    global logger
-    logger = logging.getLogger("ludwig.export")
-
-    print_ludwig("Export Neuropod", LUDWIG_VERSION)
-
-    export_neuropod(**vars(args))
+    _run_export_cli(parser, sys_argv, "export_neuropod", "Export Neuropod", export_neuropod)
 
 
 def cli_export_mlflow(sys_argv):
-    parser = argparse.ArgumentParser(
-        description="This script loads a pretrained model " "and saves it as an MLFlow model.",
-        prog="ludwig export_mlflow",
-        usage="%(prog)s [options]",
+    parser = _make_export_parser(
+        "This script loads a pretrained model and saves it as an MLFlow model.", "ludwig export_mlflow"
     )
-
-    # ----------------
-    # Model parameters
-    # ----------------
-    parser.add_argument("-m", "--model_path", help="model to load", required=True)
     parser.add_argument(
         "-mn",
         "--registered_model_name",
@@ -397,32 +308,7 @@ def cli_export_mlflow(sys_argv):
         "-op", "--output_path", type=str, help="path where to save the exported model", default="mlflow"
     )
 
-    # ------------------
-    # Runtime parameters
-    # ------------------
-    parser.add_argument(
-        "-l",
-        "--logging_level",
-        default="info",
-        help="the level of logging to use",
-        choices=["critical", "error", "warning", "info", "debug", "notset"],
-    )
-
-    add_contrib_callback_args(parser)
-    args = parser.parse_args(sys_argv)
-
-    args.callbacks = args.callbacks or []
-    for callback in args.callbacks:
-        callback.on_cmdline("export_mlflow", *sys_argv)
-
-    args.logging_level = get_logging_level_registry()[args.logging_level]
-    logging.getLogger("ludwig").setLevel(args.logging_level)
-    global logger
-    logger = logging.getLogger("ludwig.export")
-
-    print_ludwig("Export MLFlow", LUDWIG_VERSION)
-
-    export_mlflow(**vars(args))
+    _run_export_cli(parser, sys_argv, "export_mlflow", "Export MLFlow", export_mlflow)
 
 
 if __name__ == "__main__":
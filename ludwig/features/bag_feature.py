@@ -14,14 +14,15 @@
 # limitations under the License.
 # ==============================================================================
 import logging
-from collections import Counter
 
 import numpy as np
+import pandas as pd
 import torch
+from scipy import sparse
 
 from ludwig.constants import BAG, COLUMN, NAME, PROC_COLUMN
 from ludwig.features.base_feature import BaseFeatureMixin, InputFeature
-from ludwig.features.feature_utils import set_str_to_idx
+from ludwig.features.feature_utils import set_str_to_idx_batch
 from ludwig.features.set_feature import _SetPreprocessing
 from ludwig.schema.features.bag_feature import BagInputFeatureConfig
 from ludwig.types import FeatureMetadataDict, ModelConfigDict, PreprocessingConfigDict, TrainingSetMetadataDict
@@ -29,6 +30,33 @@ from ludwig.utils.strings_utils import create_vocabulary
 
 logger = logging.getLogger(__name__)
 
+# Bag vectors store token counts as int16.
+BAG_COUNT_MAX = np.iinfo(np.int16).max
+
+
+def _bag_vectors(column: pd.Series, str2idx: dict, tokenizer_name: str) -> pd.Series:
+    """Returns the bag-of-tokens count vector of every row of a partition.
+
+    The token ids of all rows are collected into a single CSR matrix, which sums repeated tokens within a row, rather
+    than building a counter and a dense vector row by row. Counts are stored as int16, half the size of float32
+    vectors, and saturate at the int16 maximum. Each distinct string is only tokenized and counted once, and rows
+    holding the same string share a single dense vector, so the partition never materializes more than one dense row
+    per distinct string.
+    """
+    codes, uniques = pd.factorize(column)
+    if (codes < 0).any():
+        raise ValueError(f"Cannot build bag vectors for missing values in column {column.name}.")
+    indices, row_lengths = set_str_to_idx_batch(uniques, str2idx, tokenizer_name)
+
+    indptr = np.zeros(len(row_lengths) + 1, dtype=np.int64)
+    np.cumsum(row_lengths, out=indptr[1:])
+    data = np.ones(len(indices), dtype=np.int32)
+    bags = sparse.csr_matrix((data, indices, indptr), shape=(len(uniques), len(str2idx)))
+    bags.sum_duplicates()
+    np.minimum(bags.data, BAG_COUNT_MAX, out=bags.data)
+    vectors = list(bags.astype(np.int16).toarray())
+    return pd.Series([vectors[code] for code in codes], index=column.index)
+
 
 class BagFeatureMixin(BaseFeatureMixin):
     @staticmethod
@@ -64,14 +92,10 @@ class BagFeatureMixin(BaseFeatureMixin):
 
     @staticmethod
     def feature_data(column, metadata, preprocessing_parameters: PreprocessingConfigDict, backend):
-        def to_vector(set_str):
-            bag_vector = np.zeros((len(metadata["str2idx"]),), dtype=np.float32)
-            col_counter = Counter(set_str_to_idx(set_str, metadata["str2idx"], preprocessing_parameters["tokenizer"]))
-
-            bag_vector[list(col_counter.keys())] = list(col_counter.values())
-            return bag_vector
-
-        return backend.df_engine.map_objects(column, to_vector)
+        return backend.df_engine.map_partitions(
+            column,
+            lambda partition: _bag_vectors(partition, metadata["str2idx"], preprocessing_parameters["tokenizer"]),
+        )
 
     @staticmethod
     def add_feature_data(
@@ -101,9 +125,13 @@ class BagInputFeature(BagFeatureMixin, InputFeature):
         else:
             self.encoder_obj = self.initialize_encoder(input_feature_config.encoder)
 
+        # The vocabulary is fixed once the encoder is built, so the input shape only needs to be computed once.
+        self._input_shape = torch.Size([len(self.encoder_obj.config.vocab)])
+
     def forward(self, inputs):
-        assert isinstance(inputs, torch.Tensor)
-        # assert inputs.dtype == tf.bool # this fails
+        # Preprocessed bag vectors hold int16 counts, while the encoder weights the embeddings by float32 frequencies.
+        # The cast is a no-op for float32 inputs, e.g. from the torchscript preprocessing module.
+        inputs = inputs.to(torch.float32)
 
         encoder_output = self.encoder_obj(inputs)
 
@@ -111,7 +139,7 @@ class BagInputFeature(BagFeatureMixin, InputFeature):
 
     @property
     def input_shape(self) -> torch.Size:
-        return torch.Size([len(self.encoder_obj.config.vocab)])
+        return self._input_shape
 
     @property
     def output_shape(self) -> torch.Size:
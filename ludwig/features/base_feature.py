@@ -15,6 +15,7 @@
 import logging
 from abc import ABC, abstractmethod, abstractstaticmethod
 from dataclasses import dataclass
+from functools import lru_cache
 from typing import Any, Dict, Optional
 
 import torch
@@ -53,6 +54,19 @@ from ludwig.utils.types import DataFrame, TorchscriptPreprocessingInput
 
 logger = logging.getLogger(__name__)
 
+# Supplemental combiner outputs that are passed through to the output feature decoders, when present.
+DECODER_PASSTHROUGH_KEYS = (ENCODER_OUTPUT_STATE, LENGTHS)
+
+
+@lru_cache(maxsize=None)
+def _get_config_schema(config_cls):
+    """Returns a marshmallow schema instance for the encoder or decoder config class.
+
+    Building a marshmallow schema is much more expensive than dumping a config with it, and dumping does not modify the
+    schema, so one instance is shared by every feature that uses the same config class.
+    """
+    return config_cls.Schema()
+
 
 class BaseFeatureMixin(ABC):
     """Parent class for feature mixins.
@@ -186,8 +200,7 @@ class InputFeature(BaseFeature, LudwigModule, ABC):
 
     def initialize_encoder(self, encoder_config):
         encoder_cls = get_encoder_cls(self.type(), encoder_config.type)
-        encoder_schema = encoder_cls.get_schema_cls().Schema()
-        encoder_params_dict = encoder_schema.dump(encoder_config)
+        encoder_params_dict = _get_config_schema(encoder_cls.get_schema_cls()).dump(encoder_config)
         return encoder_cls(encoder_config=encoder_config, **encoder_params_dict)
 
     @classmethod
@@ -281,18 +294,15 @@ class OutputFeature(BaseFeature, LudwigModule, ABC):
         # Input to the decoder is the output feature's FC hidden layer.
         decoder_config.input_size = self.fc_stack.output_shape[-1]
         decoder_cls = get_decoder_cls(self.type(), decoder_config.type)
-        decoder_schema = decoder_cls.get_schema_cls().Schema()
-        decoder_params_dict = decoder_schema.dump(decoder_config)
+        decoder_params_dict = _get_config_schema(decoder_cls.get_schema_cls()).dump(decoder_config)
         return decoder_cls(decoder_config=decoder_config, **decoder_params_dict)
 
     def train_loss(self, targets: Tensor, predictions: Dict[str, Tensor], feature_name):
-        loss_class = type(self.train_loss_function)
-        prediction_key = output_feature_utils.get_feature_concat_name(feature_name, loss_class.get_loss_inputs())
+        prediction_key = output_feature_utils.get_feature_concat_name(feature_name, self._loss_input_key)
         return self.train_loss_function(predictions[prediction_key], targets)
 
     def eval_loss(self, targets: Tensor, predictions: Dict[str, Tensor]):
-        loss_class = type(self.train_loss_function)
-        prediction_key = loss_class.get_loss_inputs()
+        prediction_key = self._loss_input_key
         if isinstance(self.eval_loss_metric, MeanMetric):
             # MeanMetric's forward() implicitly updates the running average.
             # For MeanMetrics, we use get_current_value() to compute the loss without changing the state. All metrics
@@ -302,6 +312,8 @@ class OutputFeature(BaseFeature, LudwigModule, ABC):
 
     def _setup_loss(self):
         self.train_loss_function = create_loss(self.loss)
+        # The name of the prediction tensor the loss is computed on, resolved once rather than on every step.
+        self._loss_input_key = type(self.train_loss_function).get_loss_inputs()
         self._eval_loss_metric = ModuleWrapper(get_metric_cls(self.type(), self.loss.type)(config=self.loss))
 
     def _setup_metrics(self):
@@ -316,6 +328,10 @@ class OutputFeature(BaseFeature, LudwigModule, ABC):
             **kwargs,
         }
         self.metric_names = sorted(list(self._metric_functions.keys()))
+        # Resolved once here so update_metrics() only does dict lookups on every batch.
+        self._metric_input_keys = {name: get_metric_tensor_input(name) for name in self._metric_functions}
+        # The device the metrics were last moved to, so they are only moved when the predictions change device.
+        self._metrics_device: Optional[torch.device] = None
 
     def create_calibration_module(self, feature: BaseOutputFeatureConfig) -> CalibrationModule:
         """Creates and returns a CalibrationModule that converts logits to a probability distribution."""
@@ -382,9 +398,12 @@ class OutputFeature(BaseFeature, LudwigModule, ABC):
             predictions: Dict of tensors returned by predictions().
         """
         for metric_name, metric_fn in self._metric_functions.items():
-            prediction_key = get_metric_tensor_input(metric_name)
-            metric_fn = metric_fn.to(predictions[prediction_key].device)
-            metric_fn.update(predictions[prediction_key].detach(), targets)
+            prediction = predictions[self._metric_input_keys[metric_name]]
+            if prediction.device != self._metrics_device:
+                for fn in self._metric_functions.values():
+                    fn.to(prediction.device)
+                self._metrics_device = prediction.device
+            metric_fn.update(prediction.detach(), targets)
 
     def get_metrics(self):
         metric_vals = {}
@@ -395,15 +414,16 @@ class OutputFeature(BaseFeature, LudwigModule, ABC):
                 logger.exception(f"Caught exception computing metric: {metric_name} with error: {e}.")
                 continue
 
-            # Metrics from torchmetrics can be a straightforward tensor.
+            # Metrics from torchmetrics can be a straightforward tensor. `item()` reads the scalar straight off the
+            # device instead of copying it to a host tensor and a numpy array first.
             if isinstance(computed_metric, Tensor):
-                metric_vals[metric_name] = computed_metric.detach().cpu().numpy().item()
+                metric_vals[metric_name] = computed_metric.item()
             else:
                 # Metrics from torchmetrics can be a dict of tensors.
                 # For example, ROUGE is returned as a dictionary of tensors.
                 # Unpack.
                 for sub_metric_name, metric in computed_metric.items():
-                    metric_vals[sub_metric_name] = metric.detach().cpu().numpy().item()
+                    metric_vals[sub_metric_name] = metric.item()
         return metric_vals
 
     def reset_metrics(self):
@@ -435,12 +455,11 @@ class OutputFeature(BaseFeature, LudwigModule, ABC):
         hidden = self.prepare_decoder_inputs(combiner_hidden, other_output_feature_outputs, mask=mask)
 
         # ================ Predictions ================
-        logits_input = {HIDDEN: hidden}
-        # pass supplemental data from encoders to decoder
-        if ENCODER_OUTPUT_STATE in combiner_outputs:
-            logits_input[ENCODER_OUTPUT_STATE] = combiner_outputs[ENCODER_OUTPUT_STATE]
-        if LENGTHS in combiner_outputs:
-            logits_input[LENGTHS] = combiner_outputs[LENGTHS]
+        logits_input = {
+            HIDDEN: hidden,
+            # pass supplemental data from encoders to decoder
+            **{key: combiner_outputs[key] for key in DECODER_PASSTHROUGH_KEYS if key in combiner_outputs},
+        }
 
         logits = self.logits(logits_input, target=target)
 
@@ -489,20 +508,18 @@ class OutputFeature(BaseFeature, LudwigModule, ABC):
 
     def output_specific_fully_connected(self, inputs, mask=None):
         feature_hidden = inputs
-        original_feature_hidden = inputs
+        original_shape = inputs.shape
 
         # flatten inputs
-        if len(original_feature_hidden.shape) > 2:
-            feature_hidden = torch.reshape(feature_hidden, (-1, list(feature_hidden.shape)[-1]))
+        if len(original_shape) > 2:
+            feature_hidden = feature_hidden.flatten(0, -2)
 
         # pass it through fc_stack
         feature_hidden = self.fc_stack(feature_hidden, mask=mask)
-        feature_hidden_size = feature_hidden.shape[-1]
 
-        # reshape back to original first and second dimension
-        if len(original_feature_hidden.shape) > 2:
-            sequence_length = original_feature_hidden.shape[1]
-            feature_hidden = torch.reshape(feature_hidden, (-1, sequence_length, feature_hidden_size))
+        # reshape back to original leading dimensions
+        if len(original_shape) > 2:
+            feature_hidden = feature_hidden.unflatten(0, original_shape[:-1])
 
         return feature_hidden
 
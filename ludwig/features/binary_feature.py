@@ -222,9 +222,9 @@ class BinaryInputFeature(BinaryFeatureMixin, InputFeature):
 
         # Inputs to the binary encoder could be of dtype torch.bool. Linear layer
         # weights are of dtype torch.float32. The inputs and the weights need to
-        # be of the same dtype.
-        if inputs.dtype == torch.bool:
-            inputs = inputs.type(torch.float32)
+        # be of the same dtype. The cast is a no-op for float32 inputs, so there is
+        # no need to branch on the dtype, which keeps the scripted graph branch-free.
+        inputs = inputs.to(torch.float32)
 
         encoder_outputs = self.encoder_obj(inputs)
         return encoder_outputs
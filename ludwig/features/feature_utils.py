@@ -14,9 +14,11 @@
 # limitations under the License.
 # ==============================================================================
 import re
+from functools import lru_cache
 from typing import Dict, List, Optional, Tuple, Union
 
 import numpy as np
+import pandas as pd
 import torch
 
 from ludwig.constants import NAME, PREPROCESSING, SEQUENCE, TEXT, TIMESERIES, TYPE
@@ -37,17 +39,45 @@ def should_regularize(regularize_layers):
     return regularize
 
 
-def set_str_to_idx(set_string, feature_dict, tokenizer_name):
+@lru_cache(maxsize=None)
+def get_set_tokenizer(tokenizer_name: str) -> torch.nn.Module:
+    """Returns the tokenizer used to split set and bag strings.
+
+    Tokenizers are stateless once constructed, so a single instance per tokenizer name is shared by every call rather
+    than constructing one per row.
+    """
     try:
-        tokenizer = get_tokenizer_from_registry(tokenizer_name)()
+        return get_tokenizer_from_registry(tokenizer_name)()
     except ValueError:
         raise Exception(f"Tokenizer {tokenizer_name} not supported")
 
-    out = [feature_dict.get(item, feature_dict[UNKNOWN_SYMBOL]) for item in tokenizer(set_string)]
+
+def set_str_to_idx(set_string, feature_dict, tokenizer_name):
+    tokenizer = get_set_tokenizer(tokenizer_name)
+    unknown_idx = feature_dict[UNKNOWN_SYMBOL]
+    out = [feature_dict.get(item, unknown_idx) for item in tokenizer(set_string)]
 
     return np.array(out, dtype=np.int32)
 
 
+def set_str_to_idx_batch(set_strings, feature_dict, tokenizer_name) -> Tuple[np.ndarray, np.ndarray]:
+    """Batched version of `set_str_to_idx` for a whole column of set strings.
+
+    The tokens of all rows are mapped to their ids with a single vectorized pandas lookup rather than one dict lookup
+    per token in Python.
+
+    Returns:
+        A tuple of the token ids of all rows concatenated together, and the number of tokens in each row.
+    """
+    tokenizer = get_set_tokenizer(tokenizer_name)
+    tokens = [tokenizer(set_string) for set_string in set_strings]
+    row_lengths = np.fromiter((len(row_tokens) for row_tokens in tokens), dtype=np.int64, count=len(tokens))
+
+    flat_tokens = pd.Series([token for row_tokens in tokens for token in row_tokens], dtype=object)
+    ids = flat_tokens.map(feature_dict).fillna(feature_dict[UNKNOWN_SYMBOL]).to_numpy(dtype=np.int32)
+    return ids, row_lengths
+
+
 def compute_token_probabilities(
     probabilities: Union[list, tuple, np.ndarray],
 ) -> np.ndarray:
@@ -17,11 +17,12 @@ import logging
 from typing import Any, Dict, List, Union
 
 import numpy as np
+import pandas as pd
 import torch
 
 from ludwig.constants import COLUMN, HIDDEN, LOGITS, NAME, PREDICTIONS, PROBABILITIES, PROC_COLUMN, SET
 from ludwig.features.base_feature import BaseFeatureMixin, InputFeature, OutputFeature, PredictModule
-from ludwig.features.feature_utils import set_str_to_idx
+from ludwig.features.feature_utils import set_str_to_idx_batch
 from ludwig.schema.features.set_feature import SetInputFeatureConfig, SetOutputFeatureConfig
 from ludwig.types import (
     FeatureMetadataDict,
@@ -141,6 +142,23 @@ class _SetPredict(PredictModule):
         return {self.predictions_key: predictions, self.probabilities_key: probabilities, self.logits_key: logits}
 
 
+def _set_vectors(column: pd.Series, str2idx: dict, tokenizer_name: str) -> pd.Series:
+    """Returns the multi-hot vector of every row of a partition.
+
+    The vectors of the whole partition are filled with a single scatter into one boolean matrix, rather than allocating
+    and filling a vector row by row. Each distinct string is only tokenized once.
+    """
+    codes, uniques = pd.factorize(column)
+    if (codes < 0).any():
+        raise ValueError(f"Cannot build set vectors for missing values in column {column.name}.")
+    indices, row_lengths = set_str_to_idx_batch(uniques, str2idx, tokenizer_name)
+    rows = np.repeat(np.arange(len(row_lengths)), row_lengths)
+
+    sets = np.zeros((len(row_lengths), len(str2idx)), dtype=np.bool_)
+    sets[rows, indices] = True
+    return pd.Series(list(sets[codes]), index=column.index)
+
+
 class SetFeatureMixin(BaseFeatureMixin):
     @staticmethod
     def type():
@@ -176,14 +194,10 @@ class SetFeatureMixin(BaseFeatureMixin):
 
     @staticmethod
     def feature_data(column, metadata, preprocessing_parameters: PreprocessingConfigDict, backend):
-        def to_dense(x):
-            feature_vector = set_str_to_idx(x, metadata["str2idx"], preprocessing_parameters["tokenizer"])
-
-            set_vector = np.zeros((len(metadata["str2idx"]),))
-            set_vector[feature_vector] = 1
-            return set_vector.astype(np.bool_)
-
-        return backend.df_engine.map_objects(column, to_dense)
+        return backend.df_engine.map_partitions(
+            column,
+            lambda partition: _set_vectors(partition, metadata["str2idx"], preprocessing_parameters["tokenizer"]),
+        )
 
     @staticmethod
     def add_feature_data(
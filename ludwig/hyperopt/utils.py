@@ -228,7 +228,8 @@ def update_hyperopt_params_with_defaults(hyperopt_params: HyperoptConfigDict) ->
         hyperopt_params[EXECUTOR]["trial_driver_resources"] = {"CPU": 1, "GPU": 0}
 
     executor = get_from_registry(hyperopt_params[EXECUTOR][TYPE], executor_registry)
-    executor_defaults = {k: v for k, v in executor.__dict__.items() if k in get_class_attributes(executor)}
+    executor_attributes = get_class_attributes(executor)
+    executor_defaults = {k: v for k, v in executor.__dict__.items() if k in executor_attributes}
     set_default_values(
         hyperopt_params[EXECUTOR],
         executor_defaults,
@@ -78,6 +78,16 @@ class ComparatorCombinerConfig(BaseCombinerConfig):
         parameter_metadata=COMBINER_METADATA["comparator"]["output_size"],
     )
 
+    shared_fc: bool = schema_utils.Boolean(
+        default=False,
+        description=(
+            "Whether to use a single fully connected stack for both entities instead of one per entity. Requires "
+            "both entities to have the same flattened input size. With batch normalization, each entity is still "
+            "normalized with its own batch statistics."
+        ),
+        parameter_metadata=COMBINER_METADATA["comparator"]["shared_fc"],
+    )
+
     norm: Optional[str] = common_fields.NormField()
 
     norm_params: Optional[dict] = common_fields.NormParamsField()
@@ -14,10 +14,10 @@
 # limitations under the License.
 # ==============================================================================
 import argparse
-import io
 import json
 import logging
 import os
+import shutil
 import sys
 import tempfile
 
@@ -132,7 +132,8 @@ def _write_file(v, files):
     suffix = os.path.splitext(v.filename)[1]
     named_file = tempfile.NamedTemporaryFile(delete=False, suffix=suffix)
     files.append(named_file)
-    named_file.write(v.file.read())
+    # Stream the upload to disk in chunks rather than reading the whole file into memory first
+    shutil.copyfileobj(v.file, named_file)
     named_file.close()
     return named_file.name
 
@@ -140,7 +141,7 @@ def _write_file(v, files):
 def _read_image_buffer(v):
     # read bytes sent via REST API and convert to image tensor
     # in [channels, height, width] format
-    byte_string = io.BytesIO(v.file.read()).read()
+    byte_string = v.file.read()
     image = decode_image(torch.frombuffer(byte_string, dtype=torch.uint8))
     return image  # channels, height, width
 
@@ -109,6 +109,9 @@ CACHEABLE_FORMATS = set.union(
 
 PANDAS_DF = pd
 
+PARQUET_ROW_GROUP_TARGET_BYTES = 64 * 1024 * 1024
+PARQUET_COMPRESSION_LEVEL = 3
+
 
 # Lock over the entire interpreter as we can only have one set
 # of credentials scoped to the interpreter at once.
@@ -124,6 +127,31 @@ def get_parquet_filename(n: int):
     return f"part.{str(n).zfill(8)}.parquet"
 
 
+@DeveloperAPI
+def get_parquet_compression_kwargs() -> dict:
+    """Returns the pyarrow compression options used when caching preprocessed data as Parquet.
+
+    Zstd compresses noticeably better than the default snappy at a similar decoding speed.
+    """
+    return {"compression": "zstd", "compression_level": PARQUET_COMPRESSION_LEVEL}
+
+
+@DeveloperAPI
+def get_parquet_write_kwargs(df: DataFrame, target_row_group_bytes: int = PARQUET_ROW_GROUP_TARGET_BYTES) -> dict:
+    """Returns the pyarrow writer options used when caching an in-memory DataFrame as Parquet.
+
+    Row groups are sized to roughly `target_row_group_bytes` of in-memory data, estimated from the first rows of the
+    DataFrame, so that readers neither pay metadata overhead for tiny row groups nor shuffle at too coarse a
+    granularity.
+    """
+    head = df.head(100)
+    bytes_per_row = max(head.memory_usage(index=False, deep=True).sum() / max(len(head), 1), 1)
+    return {
+        **get_parquet_compression_kwargs(),
+        "row_group_size": max(int(target_row_group_bytes // bytes_per_row), 1),
+    }
+
+
 @DeveloperAPI
 def get_split_path(dataset_fp):
     return os.path.splitext(dataset_fp)[0] + ".split.parquet"
@@ -63,6 +63,8 @@ def concat_dependencies(
         return combiner_hidden_state
 
     dependency_hidden_states = []
+    # Only depends on the combiner hidden state, so it is shared by all non-sequential dependencies.
+    sequence_mask_3D = None
     for feature_name in dependencies:
         # The dependent feature should be present since ECD does a topological sort over output features.
         feature_hidden_state = other_output_feature_states[feature_name]
@@ -77,16 +79,14 @@ def concat_dependencies(
             else:
                 # The dependent feature is not sequential.
                 # matrix vector -> tile concat
-                sequence_max_length = combiner_hidden_state.shape[1]
-                multipliers = (1, sequence_max_length, 1)
-                tiled_representation = torch.tile(torch.unsqueeze(feature_hidden_state, 1), multipliers)
-
-                sequence_length = sequence_length_3D(combiner_hidden_state)
-                mask = sequence_mask(sequence_length, sequence_max_length)
-                tiled_representation = torch.mul(
-                    tiled_representation,
-                    mask[:, :, np.newaxis].type(torch.float32),
-                )
+                if sequence_mask_3D is None:
+                    sequence_max_length = combiner_hidden_state.shape[1]
+                    sequence_length = sequence_length_3D(combiner_hidden_state)
+                    sequence_mask_3D = sequence_mask(sequence_length, sequence_max_length)[:, :, np.newaxis]
+                    sequence_mask_3D = sequence_mask_3D.type(torch.float32)
+
+                # Broadcasting the masking multiply tiles the vector across the sequence in a single allocation.
+                tiled_representation = torch.mul(torch.unsqueeze(feature_hidden_state, 1), sequence_mask_3D)
 
                 dependency_hidden_states.append(tiled_representation)
 
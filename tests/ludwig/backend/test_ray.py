@@ -11,7 +11,7 @@ from ray.train.horovod import HorovodConfig  # noqa
 from ray.train.torch import TorchConfig  # noqa
 
 from ludwig.backend import initialize_backend  # noqa
-from ludwig.backend.ray import get_trainer_kwargs  # noqa
+from ludwig.backend.ray import _with_push_based_shuffle, get_trainer_kwargs  # noqa
 from ludwig.constants import AUTO, EXECUTOR, MAX_CONCURRENT_TRIALS, RAY  # noqa
 
 # Mark the entire module as distributed
@@ -190,3 +190,25 @@ def test_set_max_concurrent_trials(hyperopt_config_old, hyperopt_config_expected
     if hyperopt_config_old[EXECUTOR].get(MAX_CONCURRENT_TRIALS) == AUTO:
         hyperopt_config_old[EXECUTOR][MAX_CONCURRENT_TRIALS] = backend.max_concurrent_trials(hyperopt_config_old)
     assert hyperopt_config_old == hyperopt_config_expected
+
+
+def test_with_push_based_shuffle():
+    from ray.data.context import DatasetContext
+
+    class Trainer:
+        def setup(self):
+            # Record the setting seen by the trainable actor when it builds the dataset shards
+            self.use_push_based_shuffle = DatasetContext.get_current().use_push_based_shuffle
+
+    ctx = DatasetContext.get_current()
+    prev = ctx.use_push_based_shuffle
+    ctx.use_push_based_shuffle = False
+    try:
+        trainer_cls = _with_push_based_shuffle(Trainer)
+        assert trainer_cls.__name__ == Trainer.__name__
+
+        trainer = trainer_cls()
+        trainer.setup()
+        assert trainer.use_push_based_shuffle
+    finally:
+        ctx.use_push_based_shuffle = prev
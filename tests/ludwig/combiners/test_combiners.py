@@ -429,6 +429,63 @@ def test_comparator_combiner(
     assert tpc == upc, f"Failed to update parameters. Parameters not updated: {not_updated}"
 
 
+@pytest.mark.parametrize("norm", [None, "batch"])
+def test_comparator_combiner_shared_fc(encoder_comparator_outputs: Tuple, norm: Optional[str]) -> None:
+    # make repeatable
+    set_random_seed(RANDOM_SEED)
+
+    encoder_comparator_outputs_dict, input_features_dict = encoder_comparator_outputs
+    entity_1 = ["text_feature_1", "text_feature_4"]
+    entity_2 = ["image_feature_1", "image_feature_4"]
+    encoder_comparator_outputs_dict = {k: encoder_comparator_outputs_dict[k] for k in entity_1 + entity_2}
+
+    combiner = ComparatorCombiner(
+        input_features_dict,
+        config=load_config(ComparatorCombinerConfig, entity_1=entity_1, entity_2=entity_2, shared_fc=True, norm=norm),
+    ).to(DEVICE)
+    assert combiner.e1_fc_stack is combiner.e2_fc_stack
+    # With batch norm each entity is normalized with its own batch statistics, so they are projected separately
+    assert combiner.shared_fc_single_pass == (norm is None)
+
+    combiner_output = combiner(encoder_comparator_outputs_dict)
+    check_combiner_output(combiner, combiner_output, BATCH_SIZE)
+
+    # check for parameter updating
+    target = torch.randn(combiner_output["combiner_output"].shape)
+    fpc, tpc, upc, not_updated = check_module_parameters_updated(combiner, (encoder_comparator_outputs_dict,), target)
+    assert tpc == upc, f"Failed to update parameters. Parameters not updated: {not_updated}"
+
+
+def test_comparator_combiner_shared_fc_shape_mismatch(encoder_comparator_outputs: Tuple) -> None:
+    _, input_features_dict = encoder_comparator_outputs
+
+    with pytest.raises(ValueError):
+        ComparatorCombiner(
+            input_features_dict,
+            config=load_config(
+                ComparatorCombinerConfig,
+                entity_1=["text_feature_1", "text_feature_4"],
+                entity_2=["image_feature_1", "image_feature_2"],
+                shared_fc=True,
+            ),
+        )
+
+
+def test_comparator_combiner_missing_inputs(encoder_comparator_outputs: Tuple) -> None:
+    encoder_comparator_outputs_dict, input_features_dict = encoder_comparator_outputs
+    entity_1 = ["text_feature_1", "text_feature_4"]
+    entity_2 = ["image_feature_1", "image_feature_2"]
+
+    combiner = ComparatorCombiner(
+        input_features_dict,
+        config=load_config(ComparatorCombinerConfig, entity_1=entity_1, entity_2=entity_2),
+    ).to(DEVICE)
+
+    del encoder_comparator_outputs_dict["image_feature_2"]
+    with pytest.raises(ValueError, match="image_feature_2"):
+        combiner(encoder_comparator_outputs_dict)
+
+
 @pytest.mark.parametrize("output_size", [8, 16])
 @pytest.mark.parametrize("transformer_output_size", [4, 12])
 def test_transformer_combiner(encoder_outputs: tuple, transformer_output_size: int, output_size: int) -> None:
@@ -546,3 +546,18 @@ def test_check_llm_text_encoder_is_not_used_with_ecd():
         ModelConfig.from_dict(config)
 
     assert str(excinfo.value) == "Please use the `model_type: llm` for text-to-text models."
+
+
+def test_check_input_features_reports_first_invalid_feature():
+    # The text feature fails the HuggingFace tokenizer check and the binary feature the tied feature check. Input
+    # features are checked in a single pass, so the error of the first invalid feature is the one reported.
+    config = {
+        "input_features": [
+            text_feature(preprocessing={"tokenizer": "hf_tokenizer"}),
+            binary_feature(tied="missing_feature"),
+        ],
+        "output_features": [binary_feature()],
+    }
+
+    with pytest.raises(ConfigValidationError, match="Pretrained model name or path must be specified"):
+        ModelConfig.from_dict(config)
@@ -35,3 +35,39 @@ def test_from_ray_dataset_empty(tmpdir, ray_cluster_2cpu):
 
     predict_input_df = dd.from_pandas(pd.DataFrame([], columns=["cat1", "num1", "bin1"]), npartitions=1)
     model.predict(predict_input_df)
+
+
+@pytest.mark.distributed
+def test_get_npartitions_for_size():
+    from ludwig.data.dataframe.dask import get_npartitions_for_size
+
+    df = pd.DataFrame({"a": range(1000)})
+    df_size_bytes = df.memory_usage(index=True, deep=True).sum()
+
+    # Small DataFrames fit in a single partition by default.
+    assert get_npartitions_for_size(df) == 1
+    assert get_npartitions_for_size(df, target_partition_size_bytes=df_size_bytes // 4) == 4
+
+    # Never create more partitions than there are rows.
+    assert get_npartitions_for_size(df, target_partition_size_bytes=1) == len(df)
+    assert get_npartitions_for_size(pd.DataFrame({"a": []})) == 1
+
+    # The size of larger DataFrames is extrapolated from their first rows, including the strings they hold.
+    df = pd.DataFrame({"text": ["x" * 100] * 5000})
+    df_size_bytes = df.memory_usage(index=True, deep=True).sum()
+    assert get_npartitions_for_size(df, target_partition_size_bytes=df_size_bytes // 5) == 5
+
+
+@pytest.mark.distributed
+def test_has_annotations():
+    import dask
+    import dask.dataframe as dd
+
+    from ludwig.data.dataframe.dask import has_annotations
+
+    df = pd.DataFrame({"a": range(10)})
+    assert not has_annotations(dd.from_pandas(df, npartitions=2))
+
+    with dask.annotate(ray_remote_args=dict(scheduling_strategy="SPREAD")):
+        annotated_ddf = dd.from_pandas(df, npartitions=2)
+    assert has_annotations(annotated_ddf)
@@ -0,0 +1,25 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+pytest.importorskip("modin")
+
+
+@pytest.mark.distributed
+def test_to_ray_dataset_from_row_partitions(monkeypatch, ray_cluster_2cpu):
+    import modin.pandas as mpd
+    import ray.data
+
+    from ludwig.data.dataframe import modin as modin_engine_module
+    from ludwig.data.dataframe.modin import ModinEngine
+
+    def from_modin(df):
+        raise AssertionError("large numeric frames should not be converted with from_modin")
+
+    monkeypatch.setattr(modin_engine_module, "DISTRIBUTED_PUT_MIN_ELEMENTS", 10)
+    monkeypatch.setattr(ray.data, "from_modin", from_modin)
+
+    df = pd.DataFrame({"a": np.arange(100), "b": np.arange(100, dtype=np.float32)})
+    ds = ModinEngine().to_ray_dataset(mpd.DataFrame(df))
+
+    pd.testing.assert_frame_equal(ds.to_pandas().reset_index(drop=True), df)
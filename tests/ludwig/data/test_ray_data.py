@@ -2,6 +2,7 @@ import os
 import shutil
 from unittest import mock
 
+import numpy as np
 import pandas as pd
 import pytest
 
@@ -9,7 +10,14 @@ import pytest
 ray = pytest.importorskip("ray")  # noqa
 dask = pytest.importorskip("dask")  # noqa
 
-from ludwig.data.dataset.ray import RayDatasetBatcher, read_remote_parquet  # noqa
+from ludwig.data.dataframe.dask import DaskEngine  # noqa
+from ludwig.data.dataset.ray import (  # noqa
+    make_column_preparer,
+    RayDatasetBatcher,
+    RayDatasetManager,
+    read_remote_parquet,
+    stack_object_array,
+)
 
 # Mark the entire module as distributed
 pytestmark = pytest.mark.distributed
@@ -37,6 +45,22 @@ def test_async_reader_error():
         )
 
 
+def test_async_parallel_reader_producer_error():
+    def iter_batches(split, batch_size):
+        yield from split
+        if split == [3]:
+            raise RuntimeError("producer failed")
+
+    pipeline = mock.Mock()
+    pipeline.split.return_value = [[0, 1, 2], [3]]
+    batcher = mock.Mock(batch_size=1, _iter_batches=iter_batches, _prepare_batch=lambda batch: batch)
+
+    reader = RayDatasetBatcher._create_async_parallel_reader(batcher, pipeline, num_threads=2)
+    # The failure is raised to the consumer instead of leaving it waiting for the failed producer forever
+    with pytest.raises(RuntimeError, match="producer failed"):
+        list(reader)
+
+
 @pytest.fixture(scope="module")
 def parquet_file(ray_cluster_2cpu) -> str:
     """Write a multi-file parquet dataset to the cwd.
@@ -89,3 +113,85 @@ def test_read_remote_parquet(parquet_filepath: str):
         2) Not passing a filesystem object
     """
     read_remote_parquet(parquet_filepath)
+
+
+@pytest.mark.parametrize(
+    "arrays",
+    [
+        [np.arange(4), np.arange(4) + 1, np.arange(4) + 2],
+        [np.ones((2, 3), dtype=np.float32), np.zeros((2, 3), dtype=np.float32)],
+        # Mixed dtypes are promoted like np.stack does
+        [np.arange(3), np.arange(3) * 1.5],
+    ],
+)
+def test_stack_object_array(arrays):
+    values = np.empty(len(arrays), dtype=object)
+    values[:] = arrays
+
+    stacked = stack_object_array(values)
+    expected = np.stack(arrays)
+    assert stacked.dtype == expected.dtype
+    np.testing.assert_array_equal(stacked, expected)
+
+
+def test_stack_object_array_ragged():
+    values = np.empty(2, dtype=object)
+    values[:] = [np.arange(3), np.arange(4)]
+
+    with pytest.raises(ValueError):
+        stack_object_array(values)
+
+
+def test_make_column_preparer():
+    values = np.empty(3, dtype=object)
+    values[:] = [np.arange(4), np.arange(4) + 1, np.arange(4) + 2]
+
+    np.testing.assert_array_equal(make_column_preparer("a")(values), np.stack(values))
+
+    prepared = make_column_preparer("a", augmentations=lambda x: x * 2, reshape=(2, 2))(values)
+    assert prepared.shape == (3, 2, 2)
+    np.testing.assert_array_equal(prepared, np.stack(values).reshape(3, 2, 2) * 2)
+
+
+def test_make_column_preparer_passes_through_binary_columns():
+    # Binary columns are stored as bool by preprocessing, so batches are passed through without any cast or copy
+    values = np.array([True, False, True])
+    assert make_column_preparer("binary_feature")(values) is values
+
+
+def _object_column(arrays):
+    values = np.empty(len(arrays), dtype=object)
+    values[:] = arrays
+    return values
+
+
+def test_dataset_manager_save_tensor_columns(tmpdir, ray_cluster_2cpu):
+    from ray.air.util.tensor_extensions.arrow import ArrowTensorType
+
+    df = pd.DataFrame({"vector": _object_column([np.full(3, i, dtype=np.float32) for i in range(10)])})
+    backend = mock.Mock(df_engine=DaskEngine())
+    cache_path = os.path.join(tmpdir, "training.parquet")
+
+    RayDatasetManager(backend).save(cache_path, dask.dataframe.from_pandas(df, npartitions=2), {}, {}, "training")
+
+    ds = read_remote_parquet(cache_path)
+    assert isinstance(ds.schema().field("vector").type, ArrowTensorType)
+    np.testing.assert_array_equal(np.asarray(ds.to_pandas()["vector"]), np.stack(df["vector"]))
+
+
+def test_dataset_manager_save_fallback(tmpdir, ray_cluster_2cpu):
+    df = pd.DataFrame({"vector": _object_column([np.arange(i + 1) for i in range(10)])})
+    df_engine = DaskEngine()
+    backend = mock.Mock(df_engine=df_engine)
+    cache_path = os.path.join(tmpdir, "training.parquet")
+
+    # Ray raises a ValueError when a column cannot be cast to the tensor extension type
+    with mock.patch.object(
+        df_engine, "to_ray_dataset", side_effect=ValueError("cannot cast column")
+    ), mock.patch.object(df_engine, "to_parquet", wraps=df_engine.to_parquet) as to_parquet:
+        RayDatasetManager(backend).save(cache_path, dask.dataframe.from_pandas(df, npartitions=2), {}, {}, "training")
+
+    to_parquet.assert_called_once()
+    saved = read_remote_parquet(cache_path).to_pandas()
+    for expected, actual in zip(df["vector"], saved["vector"]):
+        np.testing.assert_array_equal(actual, expected)
@@ -9,6 +9,7 @@ import pytest
 
 from ludwig.data.dataframe.pandas import PandasEngine
 from ludwig.data.split import get_splitter
+from ludwig.utils.date_utils import create_vector_from_datetime_obj
 
 try:
     from ludwig.data.dataframe.dask import DaskEngine
@@ -233,6 +234,36 @@ def test_stratify_split(df_engine, nrows, atol, class_probs, ray_cluster_2cpu):
         assert s1.equals(s3)
 
 
+@pytest.mark.parametrize(
+    "class_size,probabilities,expected_sizes",
+    [
+        (7, [0.7, 0.1, 0.2], (5, 1, 1)),
+        (10, [0.7, 0.2, 0.1], (7, 2, 1)),
+    ],
+)
+def test_stratify_split_indices_small_class(class_size, probabilities, expected_sizes):
+    from ludwig.data.split import _stratify_split_indices
+
+    labels = np.array(["a"] * class_size)
+    split_indices = _stratify_split_indices(labels, probabilities, random_seed=42)
+
+    assert tuple(len(idx) for idx in split_indices) == expected_sizes
+    assert np.array_equal(np.sort(np.concatenate(split_indices)), np.arange(class_size))
+
+
+def test_stratify_split_indices_many_small_classes():
+    from ludwig.data.split import _stratify_split_indices
+
+    # Rounding the split of every class on its own would put half of the 2 row classes in the validation set
+    labels = np.array(
+        [f"pair_{i}" for i in range(300) for _ in range(2)] + [f"triple_{i}" for i in range(200) for _ in range(3)]
+    )
+    split_indices = _stratify_split_indices(labels, [0.7, 0.1, 0.2], random_seed=42)
+
+    assert tuple(len(idx) for idx in split_indices) == (840, 120, 240)
+    assert np.array_equal(np.sort(np.concatenate(split_indices)), np.arange(len(labels)))
+
+
 @pytest.mark.parametrize(
     ("df_engine", "atol"),
     [
@@ -330,6 +361,48 @@ def test_datetime_split(format, df_engine, ray_cluster_2cpu):
         min_datestr = split["date_col"].max()
 
 
+def test_datetime_split_date_vectors():
+    nrows = 100
+    start = datetime.strptime("1/1/1990 1:30 PM", "%m/%d/%Y %I:%M %p")
+    dates = [start + timedelta(hours=7 * i) for i in np.random.permutation(nrows)]
+
+    df = pd.DataFrame(np.random.randint(0, 100, size=(nrows, 3)), columns=["A", "B", "C"])
+    df["date_col"] = [create_vector_from_datetime_obj(d) for d in dates]
+    df["date"] = dates
+
+    probs = (0.7, 0.1, 0.2)
+    splitter = get_splitter(type="datetime", column="date_col", probabilities=probs)
+
+    backend = Mock()
+    backend.df_engine = PandasEngine()
+    splits = splitter.split(df, backend)
+
+    assert len(splits) == 3
+    min_date = pd.Timestamp.min
+    for split, p in zip(splits, probs):
+        assert len(split) == int(nrows * p)
+        assert np.all(split["date"] > min_date)
+        min_date = split["date"].max()
+
+
+def test_datetime_split_date_vectors_with_missing_values():
+    nrows = 100
+    start = datetime.strptime("1/1/1990 1:30 PM", "%m/%d/%Y %I:%M %p")
+    dates = [create_vector_from_datetime_obj(start + timedelta(hours=7 * i)) for i in range(nrows)]
+    # A missing value after the first row falls back to the per-row conversion instead of failing
+    dates[50] = np.nan
+
+    df = pd.DataFrame({"A": np.arange(nrows), "date_col": dates})
+
+    splitter = get_splitter(type="datetime", column="date_col", probabilities=(0.7, 0.1, 0.2))
+
+    backend = Mock()
+    backend.df_engine = PandasEngine()
+    splits = splitter.split(df, backend)
+
+    assert sum(len(split) for split in splits) == nrows
+
+
 @pytest.mark.parametrize(
     ("df_engine",),
     [
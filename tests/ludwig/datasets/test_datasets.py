@@ -1,5 +1,7 @@
 import io
+import json
 import os
+import threading
 import uuid
 from unittest import mock
 
@@ -9,12 +11,24 @@ import pytest
 import ludwig.datasets
 from ludwig.api import LudwigModel
 from ludwig.datasets.dataset_config import DatasetConfig
-from ludwig.datasets.loaders.dataset_loader import DatasetState
+from ludwig.datasets.loaders.dataset_loader import _get_http_session, _read_csv, _sha256_digest, DatasetState
 from tests.integration_tests.utils import private_test
 
 SUPPORTED_UNCOMPRESSED_FILETYPES = ["json", "jsonl", "tsv", "csv"]
 
 
+def test_http_session_per_thread():
+    session = _get_http_session()
+    assert _get_http_session() is session
+
+    # Download worker threads must not share a session
+    thread_sessions = []
+    thread = threading.Thread(target=lambda: thread_sessions.append(_get_http_session()))
+    thread.start()
+    thread.join()
+    assert thread_sessions[0] is not session
+
+
 def test_load_csv_dataset(tmpdir):
     input_df = pd.DataFrame(
         {"name": ["Raphael", "Donatello"], "mask": ["red", "purple"], "weapon": ["sai", "bo staff"], "split": [0, 1]}
@@ -43,6 +57,61 @@ def test_load_csv_dataset(tmpdir):
         pd.testing.assert_frame_equal(input_df, output_df)
 
         assert dataset.state == DatasetState.TRANSFORMED
+
+        lazy_dataset = dataset.load(lazy=True)
+        pd.testing.assert_frame_equal(
+            input_df[["name", "split"]], lazy_dataset.to_table(columns=["name", "split"]).to_pandas()
+        )
+    ludwig.datasets._get_dataset_configs.cache_clear()
+
+
+@pytest.mark.parametrize(
+    "contents",
+    [
+        "name,count,score,flag\nRaphael,1,0.5,True\nDonatello,,NA,False\n,3,1.5,True\n",
+        'name,note\nRaphael,"sai, twin"\nDonatello,"bo\nstaff"\n',
+        "name,date\nRaphael,2020-01-01\nDonatello,2020-01-02\n",
+        "name,flag\nRaphael,True\nDonatello,\n",
+        "name,name\nRaphael,sai\n",
+    ],
+    ids=["mixed_types", "quoted", "dates", "bool_with_nulls", "duplicate_names"],
+)
+def test_read_csv_matches_pandas(tmpdir, contents):
+    file_path = os.path.join(tmpdir, "input.csv")
+    with open(file_path, "w") as f:
+        f.write(contents)
+
+    pd.testing.assert_frame_equal(_read_csv(file_path), pd.read_csv(file_path))
+
+
+def test_processed_dataset_invalidated_when_raw_files_change(tmpdir):
+    input_filename = os.path.join(tmpdir, "input.csv")
+    pd.DataFrame({"name": ["Raphael", "Donatello"], "weapon": ["sai", "bo staff"]}).to_csv(input_filename, index=False)
+
+    config = DatasetConfig(
+        version=1.0,
+        name="fake_manifest_dataset",
+        download_urls=["file://" + input_filename],
+    )
+
+    ludwig.datasets._get_dataset_configs.cache_clear()
+    with mock.patch("ludwig.datasets._load_dataset_config", return_value=config):
+        dataset = ludwig.datasets.get_dataset("fake_manifest_dataset", cache_dir=tmpdir)
+        assert len(dataset.load()) == 2
+        assert dataset.state == DatasetState.TRANSFORMED
+
+        # Digests of verified raw files are recorded so unchanged files are not hashed again on later loads.
+        raw_filename = os.path.join(dataset.raw_dataset_dir, "input.csv")
+        with open(dataset.processed_manifest_path) as f:
+            assert json.load(f)["sha256"] == {"input.csv": _sha256_digest(raw_filename)}
+
+        # Changing a raw file invalidates the processed dataset, which is rebuilt on the next load.
+        pd.DataFrame({"name": ["Leonardo"], "weapon": ["katana"]}).to_csv(raw_filename, index=False)
+        assert dataset.state == DatasetState.EXTRACTED
+
+        output_df = dataset.load()
+        assert output_df["name"].tolist() == ["Leonardo"]
+        assert dataset.state == DatasetState.TRANSFORMED
     ludwig.datasets._get_dataset_configs.cache_clear()
 
 
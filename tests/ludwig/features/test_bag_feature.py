@@ -2,9 +2,12 @@ from random import choice
 from string import ascii_lowercase, ascii_uppercase, digits
 from typing import Dict
 
+import numpy as np
+import pandas as pd
 import pytest
 import torch
 
+from ludwig.backend import LocalBackend
 from ludwig.constants import ENCODER, ENCODER_OUTPUT
 from ludwig.features.bag_feature import BagInputFeature
 from ludwig.schema.features.bag_feature import BagInputFeatureConfig
@@ -43,3 +46,26 @@ def test_bag_input_feature(bag_config: Dict, encoder: str) -> None:
     bag_tensor = torch.randn([BATCH_SIZE, SEQ_SIZE, BAG_W_SIZE], dtype=torch.float32).to(DEVICE)
     encoder_output = bag_input_feature(bag_tensor)
     assert encoder_output[ENCODER_OUTPUT].shape[1:][1:] == bag_input_feature.output_shape
+
+
+def test_bag_feature_data():
+    metadata = {"str2idx": {"<UNK>": 0, "a": 1, "b": 2, "c": 3}}
+    column = pd.Series(["a b a", "c", "", "b d d", "c"])
+
+    feature_data = BagInputFeature.feature_data(column, metadata, {"tokenizer": "space"}, LocalBackend())
+
+    expected = np.array([[0, 2, 1, 0], [0, 0, 0, 1], [0, 0, 0, 0], [2, 0, 1, 0], [0, 0, 0, 1]], dtype=np.int16)
+    assert len(feature_data) == len(column)
+    for vector, expected_vector in zip(feature_data, expected):
+        assert vector.dtype == np.int16
+        np.testing.assert_array_equal(vector, expected_vector)
+    # Rows holding the same string share one vector.
+    assert feature_data[1] is feature_data[4]
+
+
+def test_bag_feature_data_missing_values():
+    metadata = {"str2idx": {"<UNK>": 0, "a": 1}}
+    column = pd.Series(["a", None])
+
+    with pytest.raises(ValueError):
+        BagInputFeature.feature_data(column, metadata, {"tokenizer": "space"}, LocalBackend())
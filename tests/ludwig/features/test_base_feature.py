@@ -0,0 +1,28 @@
+from types import SimpleNamespace
+
+import pytest
+import torch
+
+from ludwig.features.base_feature import OutputFeature
+
+
+class _FCStack(torch.nn.Module):
+    def __init__(self, input_size: int, output_size: int):
+        super().__init__()
+        self.linear = torch.nn.Linear(input_size, output_size)
+
+    def forward(self, inputs, mask=None):
+        assert inputs.dim() == 2
+        return self.linear(inputs)
+
+
+@pytest.mark.parametrize("shape", [(4, 8), (4, 5, 8), (4, 5, 3, 8)])
+def test_output_specific_fully_connected(shape):
+    fc_stack = _FCStack(8, 6)
+    feature = SimpleNamespace(fc_stack=fc_stack)
+    inputs = torch.randn(shape)
+
+    outputs = OutputFeature.output_specific_fully_connected(feature, inputs)
+
+    assert outputs.shape == (*shape[:-1], 6)
+    assert torch.allclose(outputs, fc_stack.linear(inputs))
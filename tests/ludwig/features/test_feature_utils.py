@@ -61,3 +61,15 @@ def test_compute_sequence_probability():
     )
 
     assert np.allclose(sequence_probability, [0.28])  # 0.7 * 0.4
+
+
+def test_set_str_to_idx_batch():
+    feature_dict = {"<UNK>": 0, "a": 1, "b": 2, "c": 3}
+    set_strings = ["a b", "", "c z a"]
+
+    ids, row_lengths = feature_utils.set_str_to_idx_batch(set_strings, feature_dict, "space")
+
+    expected = [feature_utils.set_str_to_idx(s, feature_dict, "space") for s in set_strings]
+    assert ids.dtype == np.int32
+    assert row_lengths.tolist() == [len(e) for e in expected]
+    assert ids.tolist() == np.concatenate(expected).tolist()
@@ -1,9 +1,12 @@
 from copy import deepcopy
 from typing import Dict
 
+import numpy as np
+import pandas as pd
 import pytest
 import torch
 
+from ludwig.backend import LocalBackend
 from ludwig.constants import ENCODER, ENCODER_OUTPUT
 from ludwig.features.set_feature import SetInputFeature
 from ludwig.schema.features.set_feature import SetInputFeatureConfig
@@ -60,3 +63,24 @@ def test_set_input_feature(set_config: Dict) -> None:
 
     encoder_output = input_feature_obj(input_tensor)
     assert encoder_output[ENCODER_OUTPUT].shape == (BATCH_SIZE, *input_feature_obj.output_shape)
+
+
+def test_set_feature_data():
+    metadata = {"str2idx": {"<UNK>": 0, "a": 1, "b": 2, "c": 3}}
+    column = pd.Series(["a b a", "c", "", "b d", "c"])
+
+    feature_data = SetInputFeature.feature_data(column, metadata, {"tokenizer": "space"}, LocalBackend())
+
+    expected = np.array([[0, 1, 1, 0], [0, 0, 0, 1], [0, 0, 0, 0], [1, 0, 1, 0], [0, 0, 0, 1]], dtype=np.bool_)
+    assert len(feature_data) == len(column)
+    for vector, expected_vector in zip(feature_data, expected):
+        assert vector.dtype == np.bool_
+        np.testing.assert_array_equal(vector, expected_vector)
+
+
+def test_set_feature_data_missing_values():
+    metadata = {"str2idx": {"<UNK>": 0, "a": 1}}
+    column = pd.Series(["a", None])
+
+    with pytest.raises(ValueError):
+        SetInputFeature.feature_data(column, metadata, {"tokenizer": "space"}, LocalBackend())
@@ -28,6 +28,8 @@ from ludwig.utils.data_utils import (
     add_sequence_feature_column,
     figure_data_format_dataset,
     get_abs_path,
+    get_parquet_compression_kwargs,
+    get_parquet_write_kwargs,
     hash_dict,
     NumpyEncoder,
     PANDAS_DF,
@@ -122,6 +124,21 @@ def test_figure_data_format_dataset():
     )
 
 
+def test_get_parquet_write_kwargs():
+    df = pd.DataFrame({"a": np.arange(1000, dtype=np.int64), "b": np.ones(1000, dtype=np.float64)})
+
+    kwargs = get_parquet_write_kwargs(df, target_row_group_bytes=1600)
+    # Each row holds 16 bytes of data
+    assert kwargs["row_group_size"] == 100
+    assert kwargs["compression"] == "zstd"
+
+    assert get_parquet_write_kwargs(df.iloc[:0])["row_group_size"] >= 1
+
+    # Partitioned DataFrames only get the compression options, without sizing row groups from their data
+    assert get_parquet_compression_kwargs().items() <= kwargs.items()
+    assert "row_group_size" not in get_parquet_compression_kwargs()
+
+
 def test_hash_dict_numpy_types():
     d = {"float32": np.float32(1)}
     assert hash_dict(d) == b"uqtgWB"